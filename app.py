@@ -2,9 +2,36 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-from datetime import datetime, timedelta
-import re
-import math
+import pyarrow as pa
+import os
+import shutil
+import tempfile
+import uuid
+from unitconv import (
+    categories,
+    conversion_tables,
+    convert,
+    convert_temperature,
+    get_formula,
+    scientific_calculator,
+)
+from unitconv.charts import FigureCache, create_enhanced_visualization
+from unitconv.assets import asset_html, vendor_html
+from unitconv.calculator import ARRAY_NAMES, compile_expression
+from unitconv.exact import convert_exact, exact_tables, to_float
+from unitconv.history import HISTORY_CAPACITY, HistoryBuffer, SQLiteHistory
+from unitconv.matrix import convert_to_units
+from unitconv.tables import comparison_table, quick_reference_table
+from unitconv.profiling import NullTimer, SectionTimer
+from unitconv.query import parse_query
+from unitconv.search import search_units
+from unitconv.batch import convert_text_file, convert_values
+from unitconv.binary import RAW_DTYPES, convert_binary_file, open_binary_input
+from unitconv.columnar import (
+    column_values, columnar_format, convert_columnar_file, iter_batches, numeric_columns, read_schema
+)
+from unitconv.parallel import SHARD_SIZE, convert_file_parallel
+from unitconv.tempfiles import BatchOutput, sweep_stale_outputs
 
 # Set page configuration
 st.set_page_config(
@@ -13,531 +40,39 @@ st.set_page_config(
     layout="wide"
 )
 
-# Include GSAP library and custom animations
-st.markdown("""
-<script src="https://cdnjs.cloudflare.com/ajax/libs/gsap/3.11.4/gsap.min.js"></script>
-<script src="https://cdnjs.cloudflare.com/ajax/libs/gsap/3.11.4/ScrollTrigger.min.js"></script>
-<script src="https://cdn.jsdelivr.net/npm/canvas-confetti@1.5.1/dist/confetti.browser.min.js"></script>
+# Opt-in rerun profiling: set UNITCONV_PROFILE=1 or open the app with ?profile=1
+if os.environ.get("UNITCONV_PROFILE") == "1" or st.query_params.get("profile") == "1":
+    if 'section_timings' not in st.session_state:
+        st.session_state.section_timings = {}
+    timer = SectionTimer(st.session_state.section_timings)
+else:
+    timer = NullTimer()
 
-<style>
-    /* Base styles */
-    .main {
-        background-color: #f0f2f6;
-        background-image: linear-gradient(135deg, #f0f2f6 0%, #e4e8f0 100%);
-    }
-    
-    h1 {
-        color: #0066cc;
-        font-size: 2.5rem;
-        font-weight: 700;
-        margin-bottom: 1rem;
-        opacity: 0;
-    }
-    
-    h2 {
-        color: #0066cc;
-        font-size: 1.8rem;
-        font-weight: 600;
-        margin-top: 1.5rem;
-        opacity: 0;
-    }
-    
-    h3 {
-        color: #0066cc;
-        font-size: 1.4rem;
-        margin-top: 1rem;
-        opacity: 0;
-    }
-    
-    /* Cards with glassmorphism effect */
-    .converter-card, .card {
-        background: rgba(255, 255, 255, 0.8);
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        border-radius: 12px;
-        padding: 20px;
-        box-shadow: 0 8px 32px rgba(0, 105, 204, 0.1);
-        margin-bottom: 25px;
-        border: 1px solid rgba(255, 255, 255, 0.2);
-        transition: transform 0.3s, box-shadow 0.3s;
-        opacity: 0;
-        transform: translateY(20px);
-    }
-    
-    .converter-card:hover, .card:hover {
-        transform: translateY(-5px);
-        box-shadow: 0 12px 36px rgba(0, 105, 204, 0.15);
-    }
-    
-    .result-display {
-        background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-        color: white;
-        padding: 20px;
-        border-radius: 12px;
-        font-size: 1.6rem;
-        font-weight: 600;
-        text-align: center;
-        margin: 15px 0;
-        box-shadow: 0 4px 20px rgba(0, 105, 204, 0.3);
-        opacity: 0;
-        transform: scale(0.95);
-    }
-    
-    .formula {
-        color: #666;
-        font-size: 0.9rem;
-        font-style: italic;
-        margin-top: 5px;
-        text-align: center;
-    }
-    
-    /* Custom Streamlit button styling */
-    .stButton>button {
-        background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-        color: white;
-        font-weight: 500;
-        border: none;
-        padding: 0.5rem 1rem;
-        border-radius: 8px;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton>button:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0, 105, 204, 0.3);
-    }
-    
-    .category-selector {
-        margin-bottom: 20px;
-    }
-    
-    footer {
-        margin-top: 3rem;
-        text-align: center;
-        color: #666;
-        font-size: 0.8rem;
-        opacity: 0;
-    }
-    
-    /* Header styling */
-    .header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 2rem;
-        padding: 1rem 0;
-        border-bottom: 1px solid rgba(0, 105, 204, 0.2);
-        opacity: 0;
-        transform: translateY(-10px);
-    }
-    
-    .logo {
-        font-size: 2.2rem;
-        font-weight: 700;
-        background: linear-gradient(135deg, #0066cc 0%, #00aaff 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        position: relative;
-    }
-    
-    .badge {
-        background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-        color: white;
-        padding: 5px 10px;
-        border-radius: 15px;
-        font-size: 0.8rem;
-        margin-left: 10px;
-        box-shadow: 0 2px 8px rgba(0, 105, 204, 0.3);
-        transition: all 0.3s ease;
-    }
-    
-    .badge:hover {
-        transform: translateY(-2px);
-        box-shadow: 0 4px 12px rgba(0, 105, 204, 0.4);
-    }
-    
-    /* Table styling */
-    table {
-        border-collapse: separate;
-        border-spacing: 0;
-        width: 100%;
-        border-radius: 8px;
-        overflow: hidden;
-        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.05);
-    }
-    
-    th {
-        background: linear-gradient(135deg, #f0f2f6 0%, #e4e8f0 100%);
-        color: #0066cc;
-        padding: 12px 15px;
-        text-align: left;
-        font-weight: 600;
-    }
-    
-    td {
-        padding: 10px 15px;
-        border-bottom: 1px solid #eee;
-    }
-    
-    tr:last-child td {
-        border-bottom: none;
-    }
-    
-    tr:nth-child(even) {
-        background-color: rgba(240, 242, 246, 0.5);
-    }
-    
-    /* Input field styling */
-    .stTextInput>div>div>input, .stNumberInput>div>div>input {
-        border-radius: 8px;
-        border: 1px solid #e0e3e9;
-        padding: 10px 15px;
-        transition: all 0.3s ease;
-    }
-    
-    .stTextInput>div>div>input:focus, .stNumberInput>div>div>input:focus {
-        border-color: #0066cc;
-        box-shadow: 0 0 0 2px rgba(0, 102, 204, 0.2);
-    }
-    
-    /* Add a subtle pattern background */
-    .main:before {
-        content: "";
-        position: fixed;
-        top: 0;
-        left: 0;
-        width: 100%;
-        height: 100%;
-        background-image: url("data:image/svg+xml,%3Csvg width='60' height='60' viewBox='0 0 60 60' xmlns='http://www.w3.org/2000/svg'%3E%3Cg fill='none' fill-rule='evenodd'%3E%3Cg fill='%230066cc' fill-opacity='0.05'%3E%3Cpath d='M36 34v-4h-2v4h-4v2h4v4h2v-4h4v-2h-4zm0-30V0h-2v4h-4v2h4v4h2V6h4V4h-4zM6 34v-4H4v4H0v2h4v4h2v-4h4v-2H6zM6 4V0H4v4H0v2h4v4h2V6h4V4H6z'/%3E%3C/g%3E%3C/g%3E%3C/svg%3E");
-        z-index: -1;
-        pointer-events: none;
-    }
-    
-    /* Add custom scrollbar */
-    ::-webkit-scrollbar {
-        width: 8px;
-        height: 8px;
-    }
-    
-    ::-webkit-scrollbar-track {
-        background: #f1f1f1;
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb {
-        background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-        border-radius: 10px;
-    }
-    
-    ::-webkit-scrollbar-thumb:hover {
-        background: linear-gradient(135deg, #005bb8 0%, #0088ee 100%);
-    }
-    
-    /* Animation classes for GSAP */
-    .fade-in {
-        opacity: 0;
-    }
-    
-    .slide-up {
-        opacity: 0;
-        transform: translateY(30px);
-    }
-    
-    .slide-left {
-        opacity: 0;
-        transform: translateX(30px);
-    }
-    
-    .scale-in {
-        opacity: 0;
-        transform: scale(0.9);
-    }
-    
-    /* Pulsing effect for result */
-    @keyframes pulse {
-        0% { box-shadow: 0 0 0 0 rgba(0, 102, 204, 0.4); }
-        70% { box-shadow: 0 0 0 10px rgba(0, 102, 204, 0); }
-        100% { box-shadow: 0 0 0 0 rgba(0, 102, 204, 0); }
-    }
-    
-    .pulse {
-        animation: pulse 2s infinite;
-    }
-    
-    /* Floating animation for cards */
-    @keyframes float {
-        0% { transform: translateY(0px); }
-        50% { transform: translateY(-5px); }
-        100% { transform: translateY(0px); }
-    }
-    
-    .float {
-        animation: float 4s ease-in-out infinite;
-    }
-</style>
+# Serve the CSS/JS assets as cached files when static serving is enabled
+STATIC_SERVING = st.get_option("server.enableStaticServing")
 
-<script>
-    // Initialize GSAP animations
-    function initGSAP() {
-        // Check if GSAP is loaded
-        if (typeof gsap !== 'undefined') {
-            // Register ScrollTrigger plugin
-            gsap.registerPlugin(ScrollTrigger);
-            
-            // Get animation speed factor if available
-            const speedFactor = window.animationSpeedFactor || 1;
-            
-            // Animation for header
-            gsap.to('.header', {
-                opacity: 1,
-                y: 0,
-                duration: 1 * speedFactor,
-                ease: "power3.out"
-            });
-            
-            // Animate headings
-            gsap.to('h1, h2, h3', {
-                opacity: 1,
-                duration: 0.8 * speedFactor,
-                stagger: 0.2 * speedFactor,
-                ease: "power2.out",
-                scrollTrigger: {
-                    trigger: 'h1, h2, h3',
-                    start: "top 90%"
-                }
-            });
-            
-            // Animate cards with 3D rotation effect
-            gsap.utils.toArray('.card, .converter-card').forEach(card => {
-                // Create a tilt effect on mouse move for cards
-                card.addEventListener('mousemove', function(e) {
-                    const rect = this.getBoundingClientRect();
-                    const x = e.clientX - rect.left; // x position within the element
-                    const y = e.clientY - rect.top; // y position within the element
-                    
-                    // Calculate rotation based on mouse position
-                    const centerX = rect.width / 2;
-                    const centerY = rect.height / 2;
-                    const rotateX = (y - centerY) / 20;
-                    const rotateY = (centerX - x) / 20;
-                    
-                    // Apply the rotation
-                    gsap.to(this, {
-                        rotateX: rotateX,
-                        rotateY: rotateY,
-                        duration: 0.5,
-                        ease: "power2.out",
-                        transformPerspective: 1000,
-                        transformOrigin: "center"
-                    });
-                });
-                
-                // Reset rotation when mouse leaves
-                card.addEventListener('mouseleave', function() {
-                    gsap.to(this, {
-                        rotateX: 0,
-                        rotateY: 0,
-                        duration: 0.5,
-                        ease: "power2.out"
-                    });
-                });
-                
-                // Animate cards on scroll
-                gsap.fromTo(card,
-                    {
-                        y: 50,
-                        opacity: 0
-                    },
-                    {
-                        y: 0,
-                        opacity: 1,
-                        duration: 0.8 * speedFactor,
-                        ease: "back.out(1.7)",
-                        scrollTrigger: {
-                            trigger: card,
-                            start: "top 90%"
-                        }
-                    }
-                );
-            });
-            
-            // Animate result with attention-grabbing effect
-            gsap.utils.toArray('.result-display').forEach(result => {
-                // Initial animation
-                gsap.fromTo(result,
-                    {
-                        scale: 0.8,
-                        opacity: 0
-                    },
-                    {
-                        scale: 1,
-                        opacity: 1,
-                        duration: 0.8 * speedFactor,
-                        ease: "elastic.out(1, 0.5)",
-                        scrollTrigger: {
-                            trigger: result,
-                            start: "top 90%"
-                        },
-                        onComplete: function() {
-                            // Add a subtle pulse animation
-                            gsap.to(result, {
-                                boxShadow: '0 8px 32px rgba(0, 105, 204, 0.4)',
-                                duration: 1.5 * speedFactor,
-                                repeat: -1,
-                                yoyo: true,
-                                ease: "sine.inOut"
-                            });
-                        }
-                    }
-                );
-            });
-            
-            // Animate buttons with hover effects
-            gsap.utils.toArray('button').forEach(button => {
-                button.addEventListener('mouseenter', () => {
-                    gsap.to(button, {
-                        scale: 1.05,
-                        duration: 0.3 * speedFactor,
-                        ease: "power1.out"
-                    });
-                });
-                
-                button.addEventListener('mouseleave', () => {
-                    gsap.to(button, {
-                        scale: 1,
-                        duration: 0.3 * speedFactor,
-                        ease: "power1.out"
-                    });
-                });
-                
-                // Add click effect
-                button.addEventListener('click', () => {
-                    gsap.timeline()
-                        .to(button, {
-                            scale: 0.95,
-                            duration: 0.1 * speedFactor
-                        })
-                        .to(button, {
-                            scale: 1,
-                            duration: 0.3 * speedFactor,
-                            ease: "back.out(2)"
-                        });
-                });
-            });
-            
-            // Add floating animation to badges
-            gsap.utils.toArray('.badge').forEach(badge => {
-                gsap.to(badge, {
-                    y: -5,
-                    duration: 2 * speedFactor,
-                    repeat: -1,
-                    yoyo: true,
-                    ease: "sine.inOut"
-                });
-            });
-            
-            // Staggered animation for table rows
-            gsap.utils.toArray('tr').forEach((row, index) => {
-                gsap.fromTo(row,
-                    {
-                        opacity: 0,
-                        x: -20
-                    },
-                    {
-                        opacity: 1,
-                        x: 0,
-                        duration: 0.5 * speedFactor,
-                        delay: index * 0.05 * speedFactor,
-                        ease: "power1.out",
-                        scrollTrigger: {
-                            trigger: row,
-                            start: "top 95%"
-                        }
-                    }
-                );
-            });
-            
-            // Footer animation
-            gsap.to('footer', {
-                opacity: 1,
-                duration: 1 * speedFactor,
-                delay: 0.5 * speedFactor,
-                scrollTrigger: {
-                    trigger: 'footer',
-                    start: "top 95%"
-                }
-            });
-        } else {
-            // If GSAP is not loaded yet, try again in 100ms
-            setTimeout(initGSAP, 100);
-        }
-    }
-    
-    // Function to celebrate conversion with confetti
-    function celebrateConversion() {
-        if (typeof confetti !== 'undefined') {
-            // Shoot confetti from the middle bottom
-            confetti({
-                particleCount: 100,
-                spread: 70,
-                origin: { y: 0.8, x: 0.5 }
-            });
-            
-            // If there's a result display, add special animation
-            const resultDisplays = document.querySelectorAll('.result-display');
-            if (resultDisplays.length > 0 && typeof gsap !== 'undefined') {
-                resultDisplays.forEach(display => {
-                    // Create a celebratory animation
-                    gsap.timeline()
-                        .to(display, {
-                            scale: 1.1,
-                            boxShadow: '0 0 30px rgba(0, 150, 255, 0.8)',
-                            duration: 0.3,
-                            ease: "back.out(2)"
-                        })
-                        .to(display, {
-                            scale: 1,
-                            boxShadow: '0 8px 32px rgba(0, 105, 204, 0.3)',
-                            duration: 0.5,
-                            ease: "elastic.out(1, 0.3)"
-                        });
-                });
-            }
-        }
-    }
-    
-    // Add click listeners to conversion buttons
-    function setupConversionButtons() {
-        // Listen for button clicks that might be conversion actions
-        document.querySelectorAll('button').forEach(button => {
-            button.addEventListener('click', function() {
-                // Filter out some buttons that shouldn't trigger confetti
-                const buttonText = button.innerText.toLowerCase();
-                if (buttonText.includes('clear') || buttonText.includes('reset') || buttonText.includes('remove')) {
-                    return;
-                }
-                
-                // Give time for Streamlit to update the UI, then celebrate
-                setTimeout(celebrateConversion, 500);
-            });
-        });
-    }
-    
-    // Run animations when document is ready or Streamlit is fully loaded
-    document.addEventListener('DOMContentLoaded', function() {
-        initGSAP();
-        setupConversionButtons();
-    });
-    
-    // Also handle Streamlit's dynamic updates
-    const observer = new MutationObserver(() => {
-        initGSAP();
-        setupConversionButtons();
-    });
-    
-    observer.observe(document.body, { childList: true, subtree: true });
-</script>
-""", unsafe_allow_html=True)
+# Animations can be switched off entirely with UNITCONV_ANIMATIONS=0 or ?animations=0
+ANIMATIONS = os.environ.get("UNITCONV_ANIMATIONS") != "0" and st.query_params.get("animations") != "0"
+
+# Third-party scripts that are not vendored are only loaded from their CDN with UNITCONV_CDN_SCRIPTS=1
+CDN_SCRIPTS = os.environ.get("UNITCONV_CDN_SCRIPTS") == "1"
+
+# Entries per page of the sidebar history viewer
+HISTORY_PAGE_SIZE = 20
+
+# GSAP duration multipliers for the Animation Speed setting
+ANIMATION_SPEEDS = {"Slow": 1.5, "Normal": 1, "Fast": 0.6}
+
+# Include GSAP library and custom animations (vendored, see unitconv.assets)
+timer.start("CSS/GSAP injection")
+if ANIMATIONS:
+    st.markdown(
+        vendor_html(STATIC_SERVING, cdn=CDN_SCRIPTS) + "\n" + asset_html("app.css", "app.js", static=STATIC_SERVING),
+        unsafe_allow_html=True,
+    )
+else:
+    st.markdown(asset_html("app.css", "no-animations.css", static=STATIC_SERVING), unsafe_allow_html=True)
+timer.stop("CSS/GSAP injection")
 
 # App header with animated badges
 st.markdown("""
@@ -550,338 +85,60 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Conversion categories and units
-categories = {
-    "Length": {
-        "Meter": 1,
-        "Kilometer": 0.001,
-        "Centimeter": 100,
-        "Millimeter": 1000,
-        "Mile": 0.000621371,
-        "Yard": 1.09361,
-        "Foot": 3.28084,
-        "Inch": 39.3701
-    },
-    "Weight/Mass": {
-        "Kilogram": 1,
-        "Gram": 1000,
-        "Milligram": 1000000,
-        "Metric Ton": 0.001,
-        "Pound": 2.20462,
-        "Ounce": 35.274
-    },
-    "Temperature": {
-        "Celsius": "base",
-        "Fahrenheit": "derived",
-        "Kelvin": "derived"
-    },
-    "Area": {
-        "Square Meter": 1,
-        "Square Kilometer": 0.000001,
-        "Square Centimeter": 10000,
-        "Square Mile": 3.861e-7,
-        "Square Yard": 1.19599,
-        "Square Foot": 10.7639,
-        "Acre": 0.000247105,
-        "Hectare": 0.0001
-    },
-    "Volume": {
-        "Cubic Meter": 1,
-        "Liter": 1000,
-        "Milliliter": 1000000,
-        "Gallon (US)": 264.172,
-        "Quart (US)": 1056.69,
-        "Pint (US)": 2113.38,
-        "Cup (US)": 4226.75,
-        "Fluid Ounce (US)": 33814
-    },
-    "Time": {
-        "Second": 1,
-        "Millisecond": 1000,
-        "Minute": 1/60,
-        "Hour": 1/3600,
-        "Day": 1/86400,
-        "Week": 1/604800,
-        "Month (30 days)": 1/2592000,
-        "Year (365 days)": 1/31536000
-    },
-    "Speed": {
-        "Meter per second": 1,
-        "Kilometer per hour": 3.6,
-        "Mile per hour": 2.23694,
-        "Foot per second": 3.28084,
-        "Knot": 1.94384
-    },
-    "Data": {
-        "Byte": 1,
-        "Kilobyte": 1/1024,
-        "Megabyte": 1/(1024**2),
-        "Gigabyte": 1/(1024**3),
-        "Terabyte": 1/(1024**4)
-    },
-    "Currency": {
-        "USD": 1,
-        "EUR": 0.92,
-        "GBP": 0.79,
-        "JPY": 149.5,
-        "CAD": 1.36,
-        "AUD": 1.52,
-        "CNY": 7.24,
-        "INR": 83.12
-    }
-}
 
-# Temperature conversion functions
-def convert_temperature(value, from_unit, to_unit):
-    # Convert to Celsius first (our base unit for temperature)
-    if from_unit == "Fahrenheit":
-        celsius = (value - 32) * 5/9
-    elif from_unit == "Kelvin":
-        celsius = value - 273.15
-    else:  # Already Celsius
-        celsius = value
-    
-    # Convert from Celsius to target unit
-    if to_unit == "Celsius":
-        return celsius
-    elif to_unit == "Fahrenheit":
-        return (celsius * 9/5) + 32
-    elif to_unit == "Kelvin":
-        return celsius + 273.15
+# Function to get the conversion history: a bounded per-session ring buffer
+# (UNITCONV_HISTORY_CAPACITY entries), or with UNITCONV_HISTORY_DB set, a
+# SQLite database shared by all sessions and kept across restarts
+def get_history():
+    path = os.environ.get("UNITCONV_HISTORY_DB")
+    if path:
+        return open_history_db(path)
+    if 'conversion_history' not in st.session_state:
+        capacity = int(os.environ.get("UNITCONV_HISTORY_CAPACITY", HISTORY_CAPACITY))
+        st.session_state.conversion_history = HistoryBuffer(capacity)
+    return st.session_state.conversion_history
 
-# Function to perform conversion
-def convert(value, from_unit, to_unit, category, conversion_dict):
-    if from_unit == to_unit:
-        return value
-    
-    # Special case for temperature
-    if category == "Temperature":
-        return convert_temperature(value, from_unit, to_unit)
-    
-    # For direct conversion dictionaries
-    # Convert to base unit first, then to target unit
-    base_value = value / conversion_dict[from_unit]
-    return base_value * conversion_dict[to_unit]
+@st.cache_resource
+def open_history_db(path):
+    return SQLiteHistory(path)
 
-# Get conversion formula
-def get_formula(from_unit, to_unit, category, value, result):
-    if category == "Temperature":
-        if from_unit == "Celsius" and to_unit == "Fahrenheit":
-            return f"{value}°C × (9/5) + 32 = {result:.6g}°F"
-        elif from_unit == "Celsius" and to_unit == "Kelvin":
-            return f"{value}°C + 273.15 = {result:.6g}K"
-        elif from_unit == "Fahrenheit" and to_unit == "Celsius":
-            return f"({value}°F - 32) × (5/9) = {result:.6g}°C"
-        elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
-            return f"({value}°F - 32) × (5/9) + 273.15 = {result:.6g}K"
-        elif from_unit == "Kelvin" and to_unit == "Celsius":
-            return f"{value}K - 273.15 = {result:.6g}°C"
-        elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
-            return f"({value}K - 273.15) × (9/5) + 32 = {result:.6g}°F"
-        else:
-            return "Same unit, no conversion needed"
-    else:
-        if from_unit == to_unit:
-            return "Same unit, no conversion needed"
-        else:
-            conversion_dict = categories[category]
-            factor = conversion_dict[from_unit]/conversion_dict[to_unit]
-            return f"{value} {from_unit} × {1/factor:.6g} = {result:.6g} {to_unit}"
+# Function to save to history; the session id keeps repeat detection per session
+def save_to_history(category, from_value, from_unit, to_value, to_unit):
+    session = st.session_state.setdefault("history_session", uuid.uuid4().hex)
+    get_history().append(category, from_value, from_unit, to_value, to_unit, session=session)
 
-# Scientific calculator function
-def scientific_calculator(expression):
-    """
-    A simple scientific calculator that evaluates mathematical expressions
-    """
-    # Replace scientific notation
-    expression = expression.replace('^', '**')
-    expression = expression.replace('×', '*')
-    expression = expression.replace('÷', '/')
-    
-    # Add support for common math functions
-    safe_dict = {
-        'sin': math.sin,
-        'cos': math.cos,
-        'tan': math.tan,
-        'sqrt': math.sqrt,
-        'log': math.log10,
-        'ln': math.log,
-        'exp': math.exp,
-        'pi': math.pi,
-        'e': math.e,
-        'abs': abs,
-        'pow': pow,
-        'round': round
-    }
-    
-    try:
-        # Evaluate the expression in a safe environment
-        return eval(expression, {"__builtins__": {}}, safe_dict)
-    except Exception as e:
-        return f"Error: {str(e)}"
+# Function to remove the temp file behind the last batch download; the file
+# also goes when the session ends, and other sessions' leftovers once stale
+def discard_batch_output():
+    output = st.session_state.pop("batch_output", None)
+    if output is not None:
+        output.discard()
+    sweep_stale_outputs()
 
-# Function to generate enhanced visualizations
-def create_enhanced_visualization(from_value, from_unit, to_unit, category):
-    """Create an enhanced visualization comparing values in two units"""
-    if from_unit == to_unit:
-        return None
-    
-    # Create a range of values around the input value
-    if from_value < 0.1:
-        values = np.linspace(0, 1, 10)
-    elif from_value < 1:
-        values = np.linspace(0, 5, 10)
-    elif from_value < 10:
-        values = np.linspace(0, 50, 10)
-    elif from_value < 100:
-        values = np.linspace(0, 500, 10)
-    else:
-        values = np.linspace(0, from_value * 5, 10)
-    
-    # Convert all values
-    converted_values = []
-    for val in values:
-        if category == "Temperature":
-            converted = convert_temperature(val, from_unit, to_unit)
-        else:
-            converted = convert(val, from_unit, to_unit, category, categories[category])
-        converted_values.append(converted)
-    
-    # Create a Plotly figure with two y-axes
-    fig = px.line(
-        x=values, 
-        y=converted_values,
-        labels={"x": f"{from_unit}", "y": f"{to_unit}"},
-        title=f"Conversion Relationship: {from_unit} to {to_unit}"
-    )
-    
-    # Enhance the plot with better styling
-    fig.update_layout(
-        plot_bgcolor="rgba(240, 242, 246, 0.8)",
-        paper_bgcolor="rgba(240, 242, 246, 0.3)",
-        font=dict(
-            family="Arial, sans-serif",
-            size=14,
-            color="#333"
-        ),
-        title=dict(
-            font=dict(
-                family="Arial, sans-serif",
-                size=20,
-                color="#0066cc"
-            )
-        ),
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0, 0, 0, 0.1)',
-            gridwidth=1,
-            zeroline=True,
-            zerolinecolor='rgba(0, 0, 0, 0.2)',
-            zerolinewidth=1,
-            title_font=dict(size=16)
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0, 0, 0, 0.1)',
-            gridwidth=1,
-            zeroline=True,
-            zerolinecolor='rgba(0, 0, 0, 0.2)',
-            zerolinewidth=1,
-            title_font=dict(size=16)
-        ),
-        margin=dict(l=40, r=40, t=50, b=40),
-        hovermode="x unified"
-    )
-    
-    # Change the line appearance
-    fig.update_traces(
-        line=dict(width=3, color='#0066cc'),
-        mode='lines+markers',
-        marker=dict(size=8, color='#0066cc', line=dict(width=2, color='white'))
-    )
-    
-    # Add points at specific value
-    fig.add_scatter(
-        x=[from_value],
-        y=[convert(from_value, from_unit, to_unit, category, categories[category]) if category != "Temperature" 
-           else convert_temperature(from_value, from_unit, to_unit)],
-        mode='markers',
-        marker=dict(size=12, color='#ff3b30', line=dict(width=2, color='white')),
-        name=f"Current Value: {from_value} {from_unit}"
-    )
-    
-    return fig
+def new_batch_output(suffix):
+    st.session_state.batch_output = BatchOutput(suffix)
+    return st.session_state.batch_output.path
 
-# Function to create a trend visualization
-def create_trend_visualization(from_value, from_unit, to_unit, category):
-    if from_unit == to_unit:
-        return None
-    
-    # Create a range of values around the input value
-    if from_value < 0.1:
-        values = np.linspace(0, 1, 10)
-    elif from_value < 1:
-        values = np.linspace(0, 5, 10)
-    elif from_value < 10:
-        values = np.linspace(0, 50, 10)
-    elif from_value < 100:
-        values = np.linspace(0, 500, 10)
-    else:
-        values = np.linspace(0, from_value * 5, 10)
-    
-    # Convert all values
-    converted_values = []
-    for val in values:
-        if category == "Temperature":
-            converted = convert_temperature(val, from_unit, to_unit)
-        else:
-            converted = convert(val, from_unit, to_unit, category, categories[category])
-        converted_values.append(converted)
-    
-    # Create the plot
-    fig = px.line(
-        x=values, 
-        y=converted_values,
-        labels={"x": f"{from_unit}", "y": f"{to_unit}"},
-        title=f"Conversion Trend: {from_unit} to {to_unit}"
-    )
-    
-    fig.update_layout(
-        plot_bgcolor="white",
-        xaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0,0,0,0.1)',
-        ),
-        yaxis=dict(
-            showgrid=True,
-            gridcolor='rgba(0,0,0,0.1)',
-        ),
-        title_font=dict(size=16),
-        margin=dict(l=40, r=40, t=40, b=40),
-    )
-    
-    return fig
-
-# Function to save to history
-def save_to_history(category, from_value, from_unit, to_value, to_unit):
-    if 'conversion_history' not in st.session_state:
-        st.session_state.conversion_history = []
-    
-    st.session_state.conversion_history.append({
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        "category": category,
-        "from_value": from_value,
-        "from_unit": from_unit,
-        "to_value": to_value,
-        "to_unit": to_unit
-    })
+def apply_quick_query():
+    # Runs before the rerun, so the converter below is drawn with the parsed selection
+    st.session_state.quick_query_error = None
+    text = st.session_state.quick_query.strip()
+    if not text:
+        return
+    try:
+        query = parse_query(text)
+    except ValueError as e:
+        st.session_state.quick_query_error = str(e)
+        return
+    st.session_state.category_select = query.category
+    st.session_state[f"from_unit_{query.category}"] = query.from_unit
+    st.session_state[f"to_unit_{query.category}"] = query.to_unit
+    st.session_state.from_value = query.value
 
-# Function to export history to CSV
-def export_history_to_csv():
-    if 'conversion_history' in st.session_state and st.session_state.conversion_history:
-        df = pd.DataFrame(st.session_state.conversion_history)
-        return df.to_csv(index=False).encode('utf-8')
-    return None
+def pick_unit(match, side):
+    # Select a unit found by the unit search as the "from" or "to" unit
+    st.session_state.category_select = match.category
+    st.session_state[f"{side}_unit_{match.category}"] = match.unit
 
 # Define business use cases
 business_use_cases = {
@@ -960,146 +217,66 @@ with st.sidebar:
     # Settings
     st.markdown("<h4>Settings</h4>", unsafe_allow_html=True)
     decimal_places = st.slider("Decimal Places", 0, 10, 6)
+    exact_mode = st.toggle(
+        "Exact mode",
+        help="Convert with exact rational factors from the unit definitions (1 in = 25.4 mm) instead of the rounded table values."
+    )
     
     # Theme settings
     st.markdown("<h4>Theme Settings</h4>", unsafe_allow_html=True)
     theme_mode = st.selectbox("Theme", ["Light", "Dark", "Auto"])
-    animation_speed = st.select_slider("Animation Speed", options=["Slow", "Normal", "Fast"])
-    
-    # Apply theme settings with JavaScript
-    theme_js = f"""
-    <script>
-        function applyTheme() {{
-            const theme = "{theme_mode}";
-            const body = document.body;
-            
-            if (theme === "Dark" || (theme === "Auto" && window.matchMedia && window.matchMedia('(prefers-color-scheme: dark)').matches)) {{
-                // Add dark mode styles
-                const darkStyles = `
-                    .main {{
-                        background-color: #121212 !important;
-                        background-image: linear-gradient(135deg, #121212 0%, #1e1e2e 100%) !important;
-                    }}
-                    
-                    h1, h2, h3, h4, h5, h6 {{
-                        color: #00aaff !important;
-                    }}
-                    
-                    p, span, div {{
-                        color: #f0f0f0 !important;
-                    }}
-                    
-                    .converter-card, .card {{
-                        background: rgba(30, 30, 46, 0.7) !important;
-                        border: 1px solid rgba(255, 255, 255, 0.1) !important;
-                    }}
-                    
-                    .stButton>button {{
-                        background: linear-gradient(135deg, #0099ff 0%, #00ccff 100%) !important;
-                    }}
-                    
-                    table {{
-                        background-color: rgba(30, 30, 46, 0.5) !important;
-                    }}
-                    
-                    th {{
-                        background: rgba(0, 0, 0, 0.3) !important;
-                        color: #00aaff !important;
-                    }}
-                    
-                    td {{
-                        border-bottom: 1px solid #333 !important;
-                        color: #ddd !important;
-                    }}
-                    
-                    tr:nth-child(even) {{
-                        background-color: rgba(0, 0, 0, 0.2) !important;
-                    }}
-                `;
-                
-                // Add or update the style element
-                let styleEl = document.getElementById('dark-theme-style');
-                if (!styleEl) {{
-                    styleEl = document.createElement('style');
-                    styleEl.id = 'dark-theme-style';
-                    document.head.appendChild(styleEl);
-                }}
-                styleEl.textContent = darkStyles;
-                
-            }} else {{
-                // Remove dark mode styles if they exist
-                const styleEl = document.getElementById('dark-theme-style');
-                if (styleEl) styleEl.remove();
-            }}
-        }}
-        
-        // Apply animation speed
-        function applyAnimationSpeed() {{
-            const speed = "{animation_speed}";
-            let speedFactor = 1;
-            
-            if (speed === "Fast") speedFactor = 0.6;
-            else if (speed === "Slow") speedFactor = 1.5;
-            
-            // Add a style tag to set a CSS variable for animation duration
-            let styleEl = document.getElementById('animation-speed-style');
-            if (!styleEl) {{
-                styleEl = document.createElement('style');
-                styleEl.id = 'animation-speed-style';
-                document.head.appendChild(styleEl);
-            }}
-            
-            styleEl.textContent = `
-                :root {{
-                    --animation-speed-factor: ${{speedFactor}};
-                }}
-            `;
-            
-            // Update GSAP animations if it's available
-            if (typeof gsap !== 'undefined') {{
-                // This will be used by GSAP animations to adjust their duration
-                window.animationSpeedFactor = speedFactor;
-            }}
-        }}
-        
-        // Run the functions
-        function updateTheme() {{
-            applyTheme();
-            applyAnimationSpeed();
-        }}
-        
-        // Apply theme immediately and whenever the DOM changes
-        updateTheme();
-        const observer = new MutationObserver(() => {{
-            updateTheme();
-        }});
-        
-        observer.observe(document.body, {{ childList: true, subtree: true }});
-        
-        // Also update when the page has fully loaded
-        window.addEventListener('load', updateTheme);
-    </script>
-    """
-    st.markdown(theme_js, unsafe_allow_html=True)
+    if ANIMATIONS:
+        animation_speed = st.select_slider("Animation Speed", options=["Slow", "Normal", "Fast"])
+    
+    # Apply theme settings: the dark style sheet is a static asset, so
+    # switching themes only swaps one small <link> tag
+    timer.start("Theme CSS")
+    if theme_mode == "Dark":
+        st.markdown(asset_html("app-dark.css", static=STATIC_SERVING), unsafe_allow_html=True)
+    elif theme_mode == "Auto":
+        st.markdown(
+            asset_html("app-dark.css", static=STATIC_SERVING, media="(prefers-color-scheme: dark)"),
+            unsafe_allow_html=True,
+        )
+    if ANIMATIONS:
+        st.markdown(
+            f"<style>:root {{ --animation-speed-factor: {ANIMATION_SPEEDS[animation_speed]}; }}</style>",
+            unsafe_allow_html=True,
+        )
+    timer.stop("Theme CSS")
     
     st.markdown("<hr>", unsafe_allow_html=True)
     
     # History section
     st.markdown("<h4>Conversion History</h4>", unsafe_allow_html=True)
     
-    if 'conversion_history' in st.session_state and st.session_state.conversion_history:
-        if st.button("Clear History"):
-            st.session_state.conversion_history = []
-            st.experimental_rerun()
-        
-        csv = export_history_to_csv()
-        if csv is not None:
-            st.download_button(
-                label="Export to CSV",
-                data=csv,
-                file_name="conversion_history.csv",
-                mime="text/csv",
-            )
+    history = get_history()
+    if len(history):
+        # A shared database holds every session's history, so one user must not wipe it
+        shared = isinstance(history, SQLiteHistory)
+        if st.button("Clear History", disabled=shared, help="The history database is shared by all users" if shared else None):
+            history.clear()
+            st.rerun()
+        
+        # Paginated viewer: only the visible page is read
+        history_pages = -(-len(history) // HISTORY_PAGE_SIZE)
+        history_page = st.number_input("History page", min_value=1, max_value=history_pages, value=1, step=1)
+        st.dataframe(
+            history.page((history_page - 1) * HISTORY_PAGE_SIZE, HISTORY_PAGE_SIZE),
+            hide_index=True,
+        )
+        
+        # The CSV is only built when the button is clicked, and then only
+        # the entries added since the previous export are encoded (callable
+        # data needs Streamlit 1.52+; requirements.txt asks for 1.56)
+        timer.start("History export")
+        st.download_button(
+            label="Export to CSV",
+            data=history.to_csv,
+            file_name="conversion_history.csv",
+            mime="text/csv",
+        )
+        timer.stop("History export")
     else:
         st.write("No conversion history yet.")
 
@@ -1119,7 +296,7 @@ if app_mode == "Standard Converter":
         <div class="tooltip-content">
             <h4>Quick Tips</h4>
             <ul>
-                <li>Choose a category and units to convert between</li>
+                <li>Type a query like "5.2 km to mi", or choose a category and units</li>
                 <li>View the conversion formula below the result</li>
                 <li>Explore the trend graph to see how values scale</li>
                 <li>Check the reference table for common conversions</li>
@@ -1127,124 +304,32 @@ if app_mode == "Standard Converter":
             <button class="close-tooltip">×</button>
         </div>
     </div>
-    
-    <script>
-        // Set up the help button functionality
-        function setupHelpButton() {
-            const helpButton = document.getElementById('helpButton');
-            const helpTooltip = document.getElementById('helpTooltip');
-            const closeTooltip = document.querySelector('.close-tooltip');
-            
-            if (helpButton && helpTooltip && closeTooltip) {
-                helpButton.addEventListener('click', () => {
-                    helpTooltip.classList.toggle('active');
-                    
-                    // Animate tooltip with GSAP if available
-                    if (typeof gsap !== 'undefined') {
-                        if (helpTooltip.classList.contains('active')) {
-                            gsap.fromTo(helpTooltip, 
-                                {opacity: 0, scale: 0.8, y: 20},
-                                {opacity: 1, scale: 1, y: 0, duration: 0.5, ease: "back.out(1.7)"}
-                            );
-                        }
-                    }
-                });
-                
-                closeTooltip.addEventListener('click', () => {
-                    helpTooltip.classList.remove('active');
-                });
-            } else {
-                // Try again if elements aren't ready
-                setTimeout(setupHelpButton, 500);
-            }
-        }
-        
-        // Run setup when DOM is loaded
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', setupHelpButton);
-        } else {
-            setupHelpButton();
-        }
-    </script>
-    
-    <style>
-        .fab-container {
-            position: fixed;
-            bottom: 30px;
-            right: 30px;
-            z-index: 999;
-        }
-        
-        .fab {
-            width: 56px;
-            height: 56px;
-            border-radius: 50%;
-            background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-            color: white;
-            border: none;
-            font-size: 24px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            box-shadow: 0 4px 12px rgba(0, 102, 204, 0.4);
-            cursor: pointer;
-            transition: all 0.3s;
-        }
-        
-        .fab:hover {
-            transform: scale(1.1) rotate(10deg);
-            box-shadow: 0 6px 16px rgba(0, 102, 204, 0.6);
-        }
-        
-        .help-tooltip {
-            position: fixed;
-            bottom: 100px;
-            right: 30px;
-            width: 300px;
-            background: white;
-            border-radius: 10px;
-            box-shadow: 0 8px 24px rgba(0, 0, 0, 0.15);
-            z-index: 998;
-            opacity: 0;
-            visibility: hidden;
-            transform: translateY(20px);
-            transition: all 0.3s;
-        }
-        
-        .help-tooltip.active {
-            opacity: 1;
-            visibility: visible;
-            transform: translateY(0);
-        }
-        
-        .tooltip-content {
-            padding: 20px;
-        }
-        
-        .tooltip-content h4 {
-            margin-top: 0;
-            color: #0066cc;
-        }
-        
-        .tooltip-content ul {
-            padding-left: 20px;
-            margin-bottom: 15px;
-        }
-        
-        .close-tooltip {
-            position: absolute;
-            top: 10px;
-            right: 10px;
-            background: none;
-            border: none;
-            font-size: 18px;
-            cursor: pointer;
-            color: #666;
-        }
-    </style>
     """, unsafe_allow_html=True)
     
+    # Free-text query: sets the category, units and value in a single rerun
+    st.text_input(
+        "Quick conversion",
+        key="quick_query",
+        placeholder="e.g. 5.2 km to mi, 72F in C, 3 GB -> MB",
+        on_change=apply_quick_query
+    )
+    if st.session_state.get("quick_query_error"):
+        st.error(f"Could not read that query: {st.session_state.quick_query_error}")
+    
+    # Fuzzy unit search over every unit name and alias, typos included
+    with st.expander("Find a unit"):
+        search_text = st.text_input("Search units", key="unit_search", placeholder="e.g. kilomter, sq ft, fahrenheit")
+        matches = search_units(search_text, limit=8) if search_text.strip() else []
+        if matches:
+            match = st.radio("Matches", matches, format_func=lambda m: f"{m.unit} ({m.category})")
+            pick_cols = st.columns(2)
+            pick_cols[0].button("Convert from this unit", on_click=pick_unit, args=(match, "from"))
+            pick_cols[1].button("Convert to this unit", on_click=pick_unit, args=(match, "to"))
+        elif search_text.strip():
+            st.write("No matching units.")
+    
     # Interactive category selection with cards
+    timer.start("Category cards")
     st.markdown("<div class='category-selector slide-up'>", unsafe_allow_html=True)
     
     # Display categories as interactive cards
@@ -1303,138 +388,8 @@ if app_mode == "Standard Converter":
                 </div>
                 """, unsafe_allow_html=True)
     
-    # JavaScript for category selection
-    st.markdown("""
-    <script>
-        function selectCategory(category) {
-            // Use Streamlit's setComponentValue to update
-            if (window.Streamlit) {
-                window.Streamlit.setComponentValue(category);
-            }
-            
-            // Update visual state immediately for better UX
-            document.querySelectorAll('.category-card').forEach(card => {
-                card.classList.remove('selected');
-            });
-            
-            // Find the card that matches the category and select it
-            document.querySelectorAll('.category-card').forEach(card => {
-                if (card.querySelector('.category-name').innerText === category) {
-                    card.classList.add('selected');
-                    
-                    // Add animation with GSAP if available
-                    if (typeof gsap !== 'undefined') {
-                        gsap.to(card, {
-                            scale: 1.05,
-                            boxShadow: '0 12px 32px rgba(0, 105, 204, 0.25)',
-                            duration: 0.3,
-                            ease: "back.out(1.5)"
-                        });
-                        
-                        gsap.to(card.querySelector('.category-icon'), {
-                            scale: 1.2,
-                            duration: 0.4,
-                            ease: "elastic.out(1, 0.5)"
-                        });
-                    }
-                }
-            });
-        }
-        
-        // Add hover animations to category cards
-        function addCategoryCardAnimations() {
-            if (typeof gsap !== 'undefined') {
-                document.querySelectorAll('.category-card:not(.selected)').forEach(card => {
-                    card.addEventListener('mouseenter', () => {
-                        gsap.to(card, {
-                            y: -5,
-                            boxShadow: '0 10px 20px rgba(0, 105, 204, 0.2)',
-                            duration: 0.3,
-                            ease: "power2.out"
-                        });
-                        
-                        gsap.to(card.querySelector('.category-icon'), {
-                            scale: 1.1,
-                            duration: 0.3,
-                            ease: "back.out(1.5)"
-                        });
-                    });
-                    
-                    card.addEventListener('mouseleave', () => {
-                        gsap.to(card, {
-                            y: 0,
-                            boxShadow: '0 4px 10px rgba(0, 105, 204, 0.1)',
-                            duration: 0.3,
-                            ease: "power2.out"
-                        });
-                        
-                        gsap.to(card.querySelector('.category-icon'), {
-                            scale: 1,
-                            duration: 0.3,
-                            ease: "power2.out"
-                        });
-                    });
-                });
-            }
-        }
-        
-        // Add mutation observer to handle Streamlit's dynamic updates
-        const catObserver = new MutationObserver(() => {
-            addCategoryCardAnimations();
-        });
-        
-        catObserver.observe(document.body, { childList: true, subtree: true });
-        
-        // Run once on load
-        if (document.readyState === 'loading') {
-            document.addEventListener('DOMContentLoaded', addCategoryCardAnimations);
-        } else {
-            addCategoryCardAnimations();
-        }
-    </script>
-    
-    <style>
-        .category-selector {
-            margin-bottom: 30px;
-        }
-        
-        .category-card {
-            background: rgba(255, 255, 255, 0.8);
-            backdrop-filter: blur(10px);
-            border-radius: 10px;
-            padding: 15px;
-            text-align: center;
-            margin-bottom: 15px;
-            cursor: pointer;
-            box-shadow: 0 4px 10px rgba(0, 105, 204, 0.1);
-            transition: transform 0.3s, box-shadow 0.3s;
-            border: 1px solid rgba(255, 255, 255, 0.3);
-        }
-        
-        .category-card:hover {
-            transform: translateY(-5px);
-            box-shadow: 0 10px 20px rgba(0, 105, 204, 0.2);
-        }
-        
-        .category-card.selected {
-            background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-            color: white;
-            transform: scale(1.05);
-            box-shadow: 0 8px 16px rgba(0, 105, 204, 0.3);
-        }
-        
-        .category-icon {
-            font-size: 2rem;
-            margin-bottom: 8px;
-        }
-        
-        .category-name {
-            font-weight: 500;
-        }
-    </style>
-    """, unsafe_allow_html=True)
-    
     st.markdown("</div>", unsafe_allow_html=True)
+    timer.stop("Category cards")
     
     # Use the selected category
     category = st.selectbox("Select category", list(categories.keys()), key="category_select", label_visibility="collapsed")
@@ -1453,16 +408,21 @@ if app_mode == "Standard Converter":
         
         with col1:
             st.markdown("<div class='card'>", unsafe_allow_html=True)
-            from_value = st.number_input("Value", value=1.0, format=f"%.{decimal_places}f")
-            from_unit = st.selectbox("From", units)
+            st.session_state.setdefault("from_value", 1.0)
+            from_value = st.number_input("Value", format=f"%.{decimal_places}f", key="from_value")
+            from_unit = st.selectbox("From", units, key=f"from_unit_{category}")
             st.markdown("</div>", unsafe_allow_html=True)
         
         with col2:
             st.markdown("<div class='card'>", unsafe_allow_html=True)
-            to_unit = st.selectbox("To", units, index=1 if len(units) > 1 else 0)
+            st.session_state.setdefault(f"to_unit_{category}", units[1] if len(units) > 1 else units[0])
+            to_unit = st.selectbox("To", units, key=f"to_unit_{category}")
             
             # Calculate the result
-            if category == "Temperature":
+            timer.start("Result computation")
+            if exact_mode:
+                result = to_float(convert_exact(from_value, from_unit, to_unit, category))
+            elif category == "Temperature":
                 result = convert_temperature(from_value, from_unit, to_unit)
             else:
                 result = convert(from_value, from_unit, to_unit, category, categories[category])
@@ -1477,38 +437,30 @@ if app_mode == "Standard Converter":
             # Display the formula
             formula = get_formula(from_unit, to_unit, category, from_value, result)
             st.markdown(f"<div class='formula'>{formula}</div>", unsafe_allow_html=True)
+            timer.stop("Result computation")
             st.markdown("</div>", unsafe_allow_html=True)
             st.markdown("</div>", unsafe_allow_html=True)
         
         # Enhanced visualization
         st.markdown("<h3>Conversion Relationship</h3>", unsafe_allow_html=True)
-        fig = create_enhanced_visualization(from_value, from_unit, to_unit, category)
+        timer.start("Conversion Relationship chart")
+        if 'figure_cache' not in st.session_state:
+            st.session_state.figure_cache = FigureCache()
+        fig = create_enhanced_visualization(
+            from_value, from_unit, to_unit, category, theme=theme_mode, cache=st.session_state.figure_cache
+        )
         if fig:
             st.plotly_chart(fig, use_container_width=True)
+        timer.stop("Conversion Relationship chart")
         
         # Quick conversion table
+        timer.start("Quick reference table")
         st.markdown("<h3>Quick Reference Table</h3>", unsafe_allow_html=True)
         if from_unit != to_unit:
-            values = [0.1, 0.5, 1, 5, 10, 50, 100]
-            if category == "Temperature" and (from_unit == "Kelvin" or to_unit == "Kelvin"):
-                # Adjust values for temperature to be more meaningful
-                if from_unit == "Kelvin" or to_unit == "Kelvin":
-                    values = [0, 10, 20, 30, 100, 200, 273.15, 373.15]
-            
-            table_data = {"From": [], "To": []}
-            
-            for val in values:
-                if category == "Temperature":
-                    converted = convert_temperature(val, from_unit, to_unit)
-                else:
-                    converted = convert(val, from_unit, to_unit, category, categories[category])
-                
-                table_data["From"].append(f"{val} {from_unit}")
-                table_data["To"].append(f"{converted:.{decimal_places}g} {to_unit}")
-            
-            st.table(pd.DataFrame(table_data))
+            st.table(quick_reference_table(category, from_unit, to_unit, decimal_places))
         else:
             st.write("Select different units to see conversion table")
+        timer.stop("Quick reference table")
         
         # Business use cases
         if category in business_use_cases:
@@ -1523,62 +475,6 @@ if app_mode == "Standard Converter":
         st.markdown("<h3>Scientific Calculator</h3>", unsafe_allow_html=True)
         st.markdown("<p>Use this calculator for complex calculations before converting units</p>", unsafe_allow_html=True)
         
-        st.markdown("""
-        <style>
-            .calculator-grid {
-                display: grid;
-                grid-template-columns: repeat(4, 1fr);
-                gap: 8px;
-                max-width: 400px;
-                margin-bottom: 20px;
-            }
-            
-            .calculator-button {
-                background: linear-gradient(135deg, #f0f2f6 0%, #e4e8f0 100%);
-                border: 1px solid rgba(0, 0, 0, 0.1);
-                border-radius: 8px;
-                padding: 12px;
-                font-size: 16px;
-                text-align: center;
-                transition: all 0.2s;
-                cursor: pointer;
-            }
-            
-            .calculator-button:hover {
-                background: linear-gradient(135deg, #e4e8f0 0%, #d8dce4 100%);
-                transform: translateY(-2px);
-            }
-            
-            .calculator-button.operator {
-                background: linear-gradient(135deg, #0066cc 0%, #0099ff 100%);
-                color: white;
-            }
-            
-            .calculator-button.function {
-                background: linear-gradient(135deg, #4a4a4a 0%, #6a6a6a 100%);
-                color: white;
-            }
-            
-            .calculator-button.equals {
-                background: linear-gradient(135deg, #4CAF50 0%, #8BC34A 100%);
-                color: white;
-                grid-column: span 2;
-            }
-            
-            .calculator-screen {
-                grid-column: span 4;
-                background-color: white;
-                border: 1px solid rgba(0, 0, 0, 0.1);
-                border-radius: 8px;
-                padding: 15px;
-                font-size: 20px;
-                text-align: right;
-                margin-bottom: 10px;
-                min-height: 30px;
-            }
-        </style>
-        """, unsafe_allow_html=True)
-        
         calc_col1, calc_col2 = st.columns([2, 1])
         
         with calc_col1:
@@ -1609,6 +505,7 @@ if app_mode == "Standard Converter":
             - Constants: `pi * 2` or `e^2`
             """)
     
+    timer.start("Unit Comparison tab")
     with converter_tabs[2]:
         st.markdown("<h3>Unit Comparison</h3>", unsafe_allow_html=True)
         st.markdown("<p>Compare multiple units side by side</p>", unsafe_allow_html=True)
@@ -1620,33 +517,9 @@ if app_mode == "Standard Converter":
         if len(comparison_units) > 0:
             comparison_value = st.number_input("Reference value", value=1.0, format=f"%.{decimal_places}f", key="compare_value")
             
-            # Create comparison table
-            compare_data = {}
-            
-            # First column is the reference unit
+            # Create comparison table (cached and shared across sessions)
             reference_unit = comparison_units[0]
-            
-            # Generate data for all selected units
-            for unit in comparison_units:
-                values = []
-                for base_val in [0.1, 0.5, 1, 5, 10, 50, 100]:
-                    # Convert from reference unit to current unit
-                    if category == "Temperature":
-                        if reference_unit == unit:
-                            result = base_val
-                        else:
-                            result = convert_temperature(base_val, reference_unit, unit)
-                    else:
-                        if reference_unit == unit:
-                            result = base_val
-                        else:
-                            result = convert(base_val, reference_unit, unit, category, categories[category])
-                    values.append(f"{result:.{decimal_places}g}")
-                
-                compare_data[f"{unit}"] = values
-            
-            # Create a DataFrame for the comparison table
-            compare_df = pd.DataFrame(compare_data, index=[f"{val} {reference_unit}" for val in [0.1, 0.5, 1, 5, 10, 50, 100]])
+            compare_df = comparison_table(category, tuple(comparison_units), decimal_places)
             
             # Display the comparison table
             st.markdown("<div class='comparison-table'>", unsafe_allow_html=True)
@@ -1654,19 +527,7 @@ if app_mode == "Standard Converter":
             st.markdown("</div>", unsafe_allow_html=True)
             
             # Create a bar chart comparing the selected value across units
-            comparison_results = []
-            for unit in comparison_units:
-                if category == "Temperature":
-                    if reference_unit == unit:
-                        result = comparison_value
-                    else:
-                        result = convert_temperature(comparison_value, reference_unit, unit)
-                else:
-                    if reference_unit == unit:
-                        result = comparison_value
-                    else:
-                        result = convert(comparison_value, reference_unit, unit, category, categories[category])
-                comparison_results.append(result)
+            comparison_results = convert_to_units(comparison_value, category, reference_unit, comparison_units).tolist()
             
             # Create a bar chart
             comparison_fig = px.bar(
@@ -1690,6 +551,7 @@ if app_mode == "Standard Converter":
             )
             
             st.plotly_chart(comparison_fig, use_container_width=True)
+    timer.stop("Unit Comparison tab")
 
 # Batch Conversion Mode
 elif app_mode == "Batch Conversion":
@@ -1710,58 +572,232 @@ elif app_mode == "Batch Conversion":
     with col2:
         to_unit = st.selectbox("To Unit", units, index=1 if len(units) > 1 else 0)
     
-    # Create a text area for manual entry
-    values_input = st.text_area(
-        "Enter values (one per line):",
-        height=200,
-        help="Enter one value per line. Example:\n1\n2\n3.5\n10.5"
+    # Paste values directly, or stream a large file through the converter
+    input_method = st.radio(
+        "Input method", ["Paste values", "Upload file", "Upload binary array", "Upload Parquet/Arrow"], horizontal=True
     )
     
-    if st.button("Convert Values"):
-        if values_input:
-            try:
-                # Parse input values
-                input_values = []
-                for line in values_input.strip().split('\n'):
-                    if line.strip():
-                        input_values.append(float(line.strip()))
+    # Optional per-value transform in calculator syntax, applied to the whole column before converting
+    transform = st.text_input(
+        "Transform before converting (optional)",
+        placeholder="e.g. x * 1.08 + 2 or sqrt(x)",
+        help="A Scientific Calculator expression in x, evaluated over all values at once."
+    ).strip()
+    transform_invalid = False
+    if transform:
+        try:
+            compile_expression(transform, ARRAY_NAMES)
+        except (SyntaxError, ValueError) as e:
+            transform_invalid = True
+            st.error(f"Invalid transform: {e}")
+    
+    if input_method == "Paste values":
+        # Create a text area for manual entry
+        values_input = st.text_area(
+            "Enter values (one per line):",
+            height=200,
+            help="Enter one value per line. Example:\n1\n2\n3.5\n10.5"
+        )
+    
+        if st.button("Convert Values", disabled=transform_invalid):
+            if values_input:
+                try:
+                    # Parse input values (blank lines are skipped by split)
+                    input_values = np.array(values_input.split(), dtype=np.float64)
                 
-                # Convert values
-                converted_values = []
-                for val in input_values:
-                    if category == "Temperature":
-                        converted = convert_temperature(val, from_unit, to_unit)
-                    else:
-                        converted = convert(val, from_unit, to_unit, category, categories[category])
-                    converted_values.append(converted)
+                    # Transform and convert all values in one vectorized pass
+                    tables = exact_tables if exact_mode else conversion_tables
+                    converted_values = convert_values(input_values, tables[category][(from_unit, to_unit)], transform, exact=exact_mode)
                 
-                # Create results dataframe
-                results_df = pd.DataFrame({
-                    f"Value ({from_unit})": input_values,
-                    f"Converted ({to_unit})": converted_values
-                })
+                    # Create results dataframe
+                    results_df = pd.DataFrame({
+                        f"Value ({from_unit})": input_values,
+                        f"Converted ({to_unit})": converted_values
+                    })
                 
-                # Display results
-                st.markdown("<h3>Conversion Results</h3>", unsafe_allow_html=True)
-                st.dataframe(results_df)
+                    # Display results
+                    st.markdown("<h3>Conversion Results</h3>", unsafe_allow_html=True)
+                    st.dataframe(results_df)
                 
-                # Add download button for results
-                csv = results_df.to_csv(index=False).encode('utf-8')
-                st.download_button(
-                    label="Download Results as CSV",
-                    data=csv,
-                    file_name="batch_conversion_results.csv",
-                    mime="text/csv",
-                )
+                    # Add download button for results
+                    csv = results_df.to_csv(index=False).encode('utf-8')
+                    st.download_button(
+                        label="Download Results as CSV",
+                        data=csv,
+                        file_name="batch_conversion_results.csv",
+                        mime="text/csv",
+                    )
                 
-                # Save the first conversion to history
-                if input_values:
-                    save_to_history(category, input_values[0], from_unit, converted_values[0], to_unit)
+                    # Save the first conversion to history
+                    if input_values.size:
+                        save_to_history(category, float(input_values[0]), from_unit, float(converted_values[0]), to_unit)
                 
-            except ValueError:
-                st.error("Please enter valid numeric values, one per line.")
-        else:
-            st.warning("Please enter values to convert.")
+                except ValueError:
+                    st.error("Please enter valid numeric values, one per line.")
+            else:
+                st.warning("Please enter values to convert.")
+    elif input_method == "Upload file":
+        uploaded_file = st.file_uploader(
+            "Upload a file (one value per line):",
+            type=["txt", "csv"],
+            help="Large files are converted chunk by chunk, so memory use stays bounded."
+        )
+        
+        if st.button("Convert File", disabled=transform_invalid):
+            if uploaded_file is not None:
+                discard_batch_output()
+                
+                try:
+                    coefficients = (exact_tables if exact_mode else conversion_tables)[category][(from_unit, to_unit)]
+                    header = (f"Value ({from_unit})", f"Converted ({to_unit})")
+                    with open(new_batch_output(".csv"), "wb") as output_file:
+                        if uploaded_file.size > SHARD_SIZE and (os.cpu_count() or 1) > 1:
+                            # Large files are sharded across a process pool, which needs a real path
+                            with tempfile.NamedTemporaryFile(prefix="batch_input_", suffix=".txt") as input_file:
+                                shutil.copyfileobj(uploaded_file, input_file)
+                                input_file.flush()
+                                rows = convert_file_parallel(
+                                    input_file.name, output_file, coefficients, header=header, transform=transform, exact=exact_mode
+                                )
+                        else:
+                            rows = convert_text_file(
+                                uploaded_file, output_file, coefficients, header=header, transform=transform, exact=exact_mode
+                            )
+                    
+                    # Display a preview read back from the output file
+                    st.markdown("<h3>Conversion Results</h3>", unsafe_allow_html=True)
+                    st.write(f"Converted {rows:,} values.")
+                    preview_df = pd.read_csv(st.session_state.batch_output.path, nrows=1000)
+                    st.dataframe(preview_df)
+                    
+                    with open(st.session_state.batch_output.path, "rb") as result_file:
+                        st.download_button(
+                            label="Download Results as CSV",
+                            data=result_file,
+                            file_name="batch_conversion_results.csv",
+                            mime="text/csv",
+                        )
+                    
+                    # Save the first conversion to history
+                    if rows:
+                        save_to_history(category, float(preview_df.iloc[0, 0]), from_unit, float(preview_df.iloc[0, 1]), to_unit)
+                
+                except ValueError:
+                    discard_batch_output()
+                    st.error("The file must contain numeric values only, one per line.")
+            else:
+                st.warning("Please upload a file to convert.")
+    elif input_method == "Upload binary array":
+        uploaded_array = st.file_uploader(
+            "Upload a binary array (.npy, or raw little-endian .f64/.f32):",
+            type=["npy", "f64", "f32"],
+            help="Arrays are memory-mapped and converted block by block, with no text parsing."
+        )
+        
+        if st.button("Convert Array", disabled=transform_invalid):
+            if uploaded_array is not None:
+                discard_batch_output()
+                extension = os.path.splitext(uploaded_array.name)[1].lower()
+                
+                try:
+                    # Memory-mapping needs real files on both sides
+                    with tempfile.NamedTemporaryFile(prefix="batch_input_", suffix=extension) as input_file:
+                        shutil.copyfileobj(uploaded_array, input_file)
+                        input_file.flush()
+                        new_batch_output(".npy")
+                        rows = convert_binary_file(
+                            input_file.name,
+                            st.session_state.batch_output.path,
+                            (exact_tables if exact_mode else conversion_tables)[category][(from_unit, to_unit)],
+                            dtype=RAW_DTYPES.get(extension, "<f8"),
+                            transform=transform,
+                            exact=exact_mode
+                        )
+                        first_value = open_binary_input(input_file.name, RAW_DTYPES.get(extension, "<f8")).reshape(-1, order="A")[:1]
+                    
+                    # Display a preview of the memory-mapped output
+                    converted_array = np.load(st.session_state.batch_output.path, mmap_mode="r")
+                    st.markdown("<h3>Conversion Results</h3>", unsafe_allow_html=True)
+                    st.write(f"Converted {rows:,} values (array shape {converted_array.shape}).")
+                    st.dataframe(pd.DataFrame({f"Converted ({to_unit})": converted_array.reshape(-1, order="A")[:1000]}))
+                    
+                    with open(st.session_state.batch_output.path, "rb") as result_file:
+                        st.download_button(
+                            label="Download Results as .npy",
+                            data=result_file,
+                            file_name="batch_conversion_results.npy",
+                            mime="application/octet-stream",
+                        )
+                    
+                    # Save the first conversion to history
+                    if rows:
+                        save_to_history(category, float(first_value[0]), from_unit, float(converted_array.reshape(-1, order="A")[0]), to_unit)
+                
+                except ValueError:
+                    discard_batch_output()
+                    st.error("The file is not a valid numeric .npy array or raw float64/float32 data.")
+            else:
+                st.warning("Please upload an array to convert.")
+    else:
+        uploaded_table = st.file_uploader(
+            "Upload a Parquet or Arrow IPC file:",
+            type=["parquet", "arrow", "feather"],
+            help="The selected columns are converted in place, batch by batch, straight from the Arrow buffers."
+        )
+        
+        table_columns = []
+        if uploaded_table is not None:
+            # The upload is already in memory, so it is read through a zero-copy buffer
+            source = pa.BufferReader(uploaded_table.getbuffer())
+            table_format = columnar_format(uploaded_table.name)
+            try:
+                table_columns = numeric_columns(read_schema(source, table_format))
+            except (ValueError, OSError):
+                st.error("The file is not a valid Parquet or Arrow IPC file.")
+        selected_columns = st.multiselect("Columns to convert", table_columns, default=table_columns[:1])
+        
+        if st.button("Convert Table", disabled=transform_invalid or not selected_columns):
+            if uploaded_table is not None:
+                discard_batch_output()
+                extension = os.path.splitext(uploaded_table.name)[1].lower()
+                
+                try:
+                    new_batch_output(extension)
+                    rows = convert_columnar_file(
+                        source,
+                        st.session_state.batch_output.path,
+                        selected_columns,
+                        (exact_tables if exact_mode else conversion_tables)[category][(from_unit, to_unit)],
+                        file_format=table_format,
+                        transform=transform,
+                        exact=exact_mode
+                    )
+                    
+                    # Display a preview of the first batch of the output
+                    preview_batch = next(iter_batches(st.session_state.batch_output.path, table_format), None)
+                    preview_df = pa.Table.from_batches([preview_batch.slice(0, 1000)]).to_pandas() if preview_batch else pd.DataFrame()
+                    st.markdown("<h3>Conversion Results</h3>", unsafe_allow_html=True)
+                    st.write(f"Converted {rows:,} rows of {', '.join(selected_columns)} to {to_unit}.")
+                    st.dataframe(preview_df)
+                    
+                    with open(st.session_state.batch_output.path, "rb") as result_file:
+                        st.download_button(
+                            label=f"Download Results as {extension}",
+                            data=result_file,
+                            file_name=f"batch_conversion_results{extension}",
+                            mime="application/octet-stream",
+                        )
+                    
+                    # Save the first conversion to history
+                    if rows:
+                        first_value = column_values(next(iter_batches(source, table_format)).column(selected_columns[0]))[0]
+                        save_to_history(category, float(first_value), from_unit, float(preview_df[selected_columns[0]].iloc[0]), to_unit)
+                
+                except (ValueError, OSError, pa.ArrowException):
+                    discard_batch_output()
+                    st.error("The file is not a valid Parquet or Arrow IPC file.")
+            else:
+                st.warning("Please upload a table to convert.")
 
 # Student Mode
 elif app_mode == "For Students":
@@ -1892,6 +928,10 @@ st.markdown("""
 </footer>
 """, unsafe_allow_html=True)
 
-
-
-
+# Rerun timing breakdown, only shown when profiling is enabled
+timer.finish()
+timing_rows = timer.summary()
+if timing_rows:
+    with st.sidebar:
+        st.markdown("<h4>Rerun Timings</h4>", unsafe_allow_html=True)
+        st.dataframe(pd.DataFrame(timing_rows), hide_index=True)
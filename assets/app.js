@@ -0,0 +1,387 @@
+// Initialize GSAP animations
+function initGSAP() {
+    // Check if GSAP is loaded
+    if (typeof gsap !== 'undefined') {
+        // Register ScrollTrigger plugin (scroll effects are skipped without it)
+        if (typeof ScrollTrigger !== 'undefined') {
+            gsap.registerPlugin(ScrollTrigger);
+        }
+
+        // Get animation speed factor if available (set by the app as a CSS variable)
+        const speedFactor = parseFloat(
+            getComputedStyle(document.documentElement).getPropertyValue('--animation-speed-factor')
+        ) || 1;
+
+        // Animation for header
+        gsap.to('.header', {
+            opacity: 1,
+            y: 0,
+            duration: 1 * speedFactor,
+            ease: "power3.out"
+        });
+
+        // Animate headings
+        gsap.to('h1, h2, h3', {
+            opacity: 1,
+            duration: 0.8 * speedFactor,
+            stagger: 0.2 * speedFactor,
+            ease: "power2.out",
+            scrollTrigger: {
+                trigger: 'h1, h2, h3',
+                start: "top 90%"
+            }
+        });
+
+        // Animate cards with 3D rotation effect
+        gsap.utils.toArray('.card, .converter-card').forEach(card => {
+            // Create a tilt effect on mouse move for cards
+            card.addEventListener('mousemove', function(e) {
+                const rect = this.getBoundingClientRect();
+                const x = e.clientX - rect.left; // x position within the element
+                const y = e.clientY - rect.top; // y position within the element
+
+                // Calculate rotation based on mouse position
+                const centerX = rect.width / 2;
+                const centerY = rect.height / 2;
+                const rotateX = (y - centerY) / 20;
+                const rotateY = (centerX - x) / 20;
+
+                // Apply the rotation
+                gsap.to(this, {
+                    rotateX: rotateX,
+                    rotateY: rotateY,
+                    duration: 0.5,
+                    ease: "power2.out",
+                    transformPerspective: 1000,
+                    transformOrigin: "center"
+                });
+            });
+
+            // Reset rotation when mouse leaves
+            card.addEventListener('mouseleave', function() {
+                gsap.to(this, {
+                    rotateX: 0,
+                    rotateY: 0,
+                    duration: 0.5,
+                    ease: "power2.out"
+                });
+            });
+
+            // Animate cards on scroll
+            gsap.fromTo(card,
+                {
+                    y: 50,
+                    opacity: 0
+                },
+                {
+                    y: 0,
+                    opacity: 1,
+                    duration: 0.8 * speedFactor,
+                    ease: "back.out(1.7)",
+                    scrollTrigger: {
+                        trigger: card,
+                        start: "top 90%"
+                    }
+                }
+            );
+        });
+
+        // Animate result with attention-grabbing effect
+        gsap.utils.toArray('.result-display').forEach(result => {
+            // Initial animation
+            gsap.fromTo(result,
+                {
+                    scale: 0.8,
+                    opacity: 0
+                },
+                {
+                    scale: 1,
+                    opacity: 1,
+                    duration: 0.8 * speedFactor,
+                    ease: "elastic.out(1, 0.5)",
+                    scrollTrigger: {
+                        trigger: result,
+                        start: "top 90%"
+                    },
+                    onComplete: function() {
+                        // Add a subtle pulse animation
+                        gsap.to(result, {
+                            boxShadow: '0 8px 32px rgba(0, 105, 204, 0.4)',
+                            duration: 1.5 * speedFactor,
+                            repeat: -1,
+                            yoyo: true,
+                            ease: "sine.inOut"
+                        });
+                    }
+                }
+            );
+        });
+
+        // Animate buttons with hover effects
+        gsap.utils.toArray('button').forEach(button => {
+            button.addEventListener('mouseenter', () => {
+                gsap.to(button, {
+                    scale: 1.05,
+                    duration: 0.3 * speedFactor,
+                    ease: "power1.out"
+                });
+            });
+
+            button.addEventListener('mouseleave', () => {
+                gsap.to(button, {
+                    scale: 1,
+                    duration: 0.3 * speedFactor,
+                    ease: "power1.out"
+                });
+            });
+
+            // Add click effect
+            button.addEventListener('click', () => {
+                gsap.timeline()
+                    .to(button, {
+                        scale: 0.95,
+                        duration: 0.1 * speedFactor
+                    })
+                    .to(button, {
+                        scale: 1,
+                        duration: 0.3 * speedFactor,
+                        ease: "back.out(2)"
+                    });
+            });
+        });
+
+        // Add floating animation to badges
+        gsap.utils.toArray('.badge').forEach(badge => {
+            gsap.to(badge, {
+                y: -5,
+                duration: 2 * speedFactor,
+                repeat: -1,
+                yoyo: true,
+                ease: "sine.inOut"
+            });
+        });
+
+        // Staggered animation for table rows
+        gsap.utils.toArray('tr').forEach((row, index) => {
+            gsap.fromTo(row,
+                {
+                    opacity: 0,
+                    x: -20
+                },
+                {
+                    opacity: 1,
+                    x: 0,
+                    duration: 0.5 * speedFactor,
+                    delay: index * 0.05 * speedFactor,
+                    ease: "power1.out",
+                    scrollTrigger: {
+                        trigger: row,
+                        start: "top 95%"
+                    }
+                }
+            );
+        });
+
+        // Footer animation
+        gsap.to('footer', {
+            opacity: 1,
+            duration: 1 * speedFactor,
+            delay: 0.5 * speedFactor,
+            scrollTrigger: {
+                trigger: 'footer',
+                start: "top 95%"
+            }
+        });
+    } else {
+        // If GSAP is not loaded yet, try again in 100ms
+        setTimeout(initGSAP, 100);
+    }
+}
+
+// Function to celebrate conversion with confetti
+function celebrateConversion() {
+    if (typeof confetti !== 'undefined') {
+        // Shoot confetti from the middle bottom
+        confetti({
+            particleCount: 100,
+            spread: 70,
+            origin: { y: 0.8, x: 0.5 }
+        });
+
+        // If there's a result display, add special animation
+        const resultDisplays = document.querySelectorAll('.result-display');
+        if (resultDisplays.length > 0 && typeof gsap !== 'undefined') {
+            resultDisplays.forEach(display => {
+                // Create a celebratory animation
+                gsap.timeline()
+                    .to(display, {
+                        scale: 1.1,
+                        boxShadow: '0 0 30px rgba(0, 150, 255, 0.8)',
+                        duration: 0.3,
+                        ease: "back.out(2)"
+                    })
+                    .to(display, {
+                        scale: 1,
+                        boxShadow: '0 8px 32px rgba(0, 105, 204, 0.3)',
+                        duration: 0.5,
+                        ease: "elastic.out(1, 0.3)"
+                    });
+            });
+        }
+    }
+}
+
+// Add click listeners to conversion buttons
+function setupConversionButtons() {
+    // Listen for button clicks that might be conversion actions
+    document.querySelectorAll('button').forEach(button => {
+        button.addEventListener('click', function() {
+            // Filter out some buttons that shouldn't trigger confetti
+            const buttonText = button.innerText.toLowerCase();
+            if (buttonText.includes('clear') || buttonText.includes('reset') || buttonText.includes('remove')) {
+                return;
+            }
+
+            // Give time for Streamlit to update the UI, then celebrate
+            setTimeout(celebrateConversion, 500);
+        });
+    });
+}
+
+// Run animations when document is ready or Streamlit is fully loaded
+document.addEventListener('DOMContentLoaded', function() {
+    initGSAP();
+    setupConversionButtons();
+});
+
+// Also handle Streamlit's dynamic updates
+const observer = new MutationObserver(() => {
+    initGSAP();
+    setupConversionButtons();
+});
+
+observer.observe(document.body, { childList: true, subtree: true });
+
+// Set up the help button functionality
+function setupHelpButton() {
+    const helpButton = document.getElementById('helpButton');
+    const helpTooltip = document.getElementById('helpTooltip');
+    const closeTooltip = document.querySelector('.close-tooltip');
+
+    if (helpButton && helpTooltip && closeTooltip) {
+        helpButton.addEventListener('click', () => {
+            helpTooltip.classList.toggle('active');
+
+            // Animate tooltip with GSAP if available
+            if (typeof gsap !== 'undefined') {
+                if (helpTooltip.classList.contains('active')) {
+                    gsap.fromTo(helpTooltip, 
+                        {opacity: 0, scale: 0.8, y: 20},
+                        {opacity: 1, scale: 1, y: 0, duration: 0.5, ease: "back.out(1.7)"}
+                    );
+                }
+            }
+        });
+
+        closeTooltip.addEventListener('click', () => {
+            helpTooltip.classList.remove('active');
+        });
+    } else {
+        // Try again if elements aren't ready
+        setTimeout(setupHelpButton, 500);
+    }
+}
+
+// Run setup when DOM is loaded
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', setupHelpButton);
+} else {
+    setupHelpButton();
+}
+
+// Category cards
+function selectCategory(category) {
+    // Use Streamlit's setComponentValue to update
+    if (window.Streamlit) {
+        window.Streamlit.setComponentValue(category);
+    }
+
+    // Update visual state immediately for better UX
+    document.querySelectorAll('.category-card').forEach(card => {
+        card.classList.remove('selected');
+    });
+
+    // Find the card that matches the category and select it
+    document.querySelectorAll('.category-card').forEach(card => {
+        if (card.querySelector('.category-name').innerText === category) {
+            card.classList.add('selected');
+
+            // Add animation with GSAP if available
+            if (typeof gsap !== 'undefined') {
+                gsap.to(card, {
+                    scale: 1.05,
+                    boxShadow: '0 12px 32px rgba(0, 105, 204, 0.25)',
+                    duration: 0.3,
+                    ease: "back.out(1.5)"
+                });
+
+                gsap.to(card.querySelector('.category-icon'), {
+                    scale: 1.2,
+                    duration: 0.4,
+                    ease: "elastic.out(1, 0.5)"
+                });
+            }
+        }
+    });
+}
+
+// Add hover animations to category cards
+function addCategoryCardAnimations() {
+    if (typeof gsap !== 'undefined') {
+        document.querySelectorAll('.category-card:not(.selected)').forEach(card => {
+            card.addEventListener('mouseenter', () => {
+                gsap.to(card, {
+                    y: -5,
+                    boxShadow: '0 10px 20px rgba(0, 105, 204, 0.2)',
+                    duration: 0.3,
+                    ease: "power2.out"
+                });
+
+                gsap.to(card.querySelector('.category-icon'), {
+                    scale: 1.1,
+                    duration: 0.3,
+                    ease: "back.out(1.5)"
+                });
+            });
+
+            card.addEventListener('mouseleave', () => {
+                gsap.to(card, {
+                    y: 0,
+                    boxShadow: '0 4px 10px rgba(0, 105, 204, 0.1)',
+                    duration: 0.3,
+                    ease: "power2.out"
+                });
+
+                gsap.to(card.querySelector('.category-icon'), {
+                    scale: 1,
+                    duration: 0.3,
+                    ease: "power2.out"
+                });
+            });
+        });
+    }
+}
+
+// Add mutation observer to handle Streamlit's dynamic updates
+const catObserver = new MutationObserver(() => {
+    addCategoryCardAnimations();
+});
+
+catObserver.observe(document.body, { childList: true, subtree: true });
+
+// Run once on load
+if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', addCategoryCardAnimations);
+} else {
+    addCategoryCardAnimations();
+}
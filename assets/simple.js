@@ -0,0 +1,84 @@
+// Function to celebrate conversion with confetti
+function celebrateConversion() {
+    if (typeof confetti !== 'undefined') {
+        confetti({
+            particleCount: 100,
+            spread: 70,
+            origin: { y: 0.8, x: 0.5 }
+        });
+    }
+}
+
+// Add click listeners to conversion buttons
+function setupEventListeners() {
+    // Set up button animations and effects
+    document.querySelectorAll('button').forEach(button => {
+        button.addEventListener('click', function() {
+            setTimeout(celebrateConversion, 500);
+        });
+
+        // Add hover animations
+        button.addEventListener('mouseenter', () => {
+            button.style.transform = 'translateY(-2px)';
+            button.style.boxShadow = '0 4px 12px rgba(0, 105, 204, 0.3)';
+        });
+
+        button.addEventListener('mouseleave', () => {
+            button.style.transform = '';
+            button.style.boxShadow = '';
+        });
+    });
+
+    // Add card tilt effects if GSAP is available
+    if (typeof gsap !== 'undefined') {
+        document.querySelectorAll('.card, .converter-card').forEach(card => {
+            card.addEventListener('mousemove', function(e) {
+                const rect = this.getBoundingClientRect();
+                const x = e.clientX - rect.left;
+                const y = e.clientY - rect.top;
+
+                const centerX = rect.width / 2;
+                const centerY = rect.height / 2;
+                const rotateX = (y - centerY) / 20;
+                const rotateY = (centerX - x) / 20;
+
+                gsap.to(this, {
+                    rotateX: rotateX,
+                    rotateY: rotateY,
+                    duration: 0.5,
+                    ease: "power2.out",
+                    transformPerspective: 1000,
+                    transformOrigin: "center"
+                });
+            });
+
+            card.addEventListener('mouseleave', function() {
+                gsap.to(this, {
+                    rotateX: 0,
+                    rotateY: 0,
+                    duration: 0.5,
+                    ease: "power2.out"
+                });
+            });
+        });
+    }
+}
+
+// Function to apply dark mode
+function applyTheme(isDark) {
+    if (isDark) {
+        document.body.classList.add('dark-mode');
+    } else {
+        document.body.classList.remove('dark-mode');
+    }
+}
+
+// Run setup when document is loaded
+document.addEventListener('DOMContentLoaded', setupEventListeners);
+
+// Handle Streamlit's dynamic updates
+const observer = new MutationObserver(() => {
+    setupEventListeners();
+});
+
+observer.observe(document.body, { childList: true, subtree: true });
@@ -0,0 +1,267 @@
+"""
+Benchmark suite for the conversion and rendering hot paths.
+
+Runs without Streamlit and writes machine-readable results, so numbers can be
+compared before and after a change:
+
+    python benchmarks.py                          # full run -> benchmark_results.json
+    python benchmarks.py --quick                  # skip the largest batch and history sizes
+    python benchmarks.py --only batch --output before.json
+"""
+
+import argparse
+import io
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+
+from unitconv import conversion_tables, convert, convert_array, convert_temperature, get_formula
+
+BATCH_SIZES = [1_000, 100_000, 10_000_000]
+HISTORY_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def measure(func, min_time=0.2, repeat=5):
+    """Return the best per-call time in seconds over `repeat` timed runs
+
+    Each run calls `func` enough times to last at least `min_time` seconds,
+    so very fast calls are not dominated by timer resolution.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time or number >= 1 << 24:
+            break
+        number *= 2 if elapsed == 0 else max(2, int(min_time / elapsed) + 1)
+
+    best = elapsed / number
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def record(results, name, seconds, **params):
+    results.append({"name": name, "params": params, "seconds": seconds})
+    details = " ".join(f"{key}={value}" for key, value in params.items())
+    print(f"{name:<40} {details:<28} {seconds * 1e6:>14.3f} us")
+
+
+def bench_convert(results):
+    record(results, "convert", measure(lambda: convert(3.5, "Mile", "Kilometer", "Length")), per="call")
+    record(results, "convert_temperature", measure(lambda: convert_temperature(98.6, "Fahrenheit", "Celsius")), per="call")
+
+    values = np.random.default_rng(0).random(1_000_000) * 100
+    as_list = values.tolist()
+    record(
+        results, "convert", measure(lambda: [convert(v, "Mile", "Kilometer", "Length") for v in as_list], repeat=3),
+        per="1M values",
+    )
+    record(
+        results, "convert_temperature",
+        measure(lambda: [convert_temperature(v, "Fahrenheit", "Celsius") for v in as_list], repeat=3),
+        per="1M values",
+    )
+    record(results, "convert_array", measure(lambda: convert_array(values, "Mile", "Kilometer", "Length")), per="1M values")
+
+    from unitconv.exact import convert_exact, convert_exact_values, exact_tables
+
+    record(results, "convert_exact", measure(lambda: convert_exact(3.5, "Mile", "Kilometer", "Length")), per="call")
+    decimals = np.round(values, 3)
+    coefficients = exact_tables["Length"][("Mile", "Kilometer")]
+    record(results, "convert_exact_values", measure(lambda: convert_exact_values(decimals, coefficients)), per="1M values")
+
+
+def bench_formula(results):
+    record(results, "get_formula", measure(lambda: get_formula("Mile", "Kilometer", "Length", 3.5, 5.632704)), category="Length")
+    record(
+        results, "get_formula", measure(lambda: get_formula("Fahrenheit", "Kelvin", "Temperature", 98.6, 310.15)),
+        category="Temperature",
+    )
+
+
+def bench_search(results):
+    from unitconv.query import parse_query
+    from unitconv.search import search_units, unit_search_index
+
+    unit_search_index()
+    record(results, "parse_query", measure(lambda: parse_query.__wrapped__("5.2 km to mi")), per="call")
+    record(results, "search_units", measure(lambda: search_units("kilomter")), per="call")
+
+
+def bench_charts(results):
+    from unitconv.charts import FigureCache, create_enhanced_visualization, create_trend_visualization
+
+    record(
+        results, "create_enhanced_visualization",
+        measure(lambda: create_enhanced_visualization(12.0, "Meter", "Foot", "Length"), min_time=1, repeat=3),
+    )
+    cache = FigureCache()
+    record(
+        results, "create_enhanced_visualization",
+        measure(lambda: create_enhanced_visualization(12.0, "Meter", "Foot", "Length", cache=cache)), cache="warm",
+    )
+    record(
+        results, "create_trend_visualization",
+        measure(lambda: create_trend_visualization(12.0, "Meter", "Foot", "Length"), min_time=1, repeat=3),
+    )
+
+
+def bench_batch(results, sizes):
+    import pandas as pd
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from unitconv.batch import convert_text_file
+    from unitconv.columnar import convert_columnar_file
+    from unitconv.frames import convert_frame
+
+    coefficients = conversion_tables["Length"][("Meter", "Foot")]
+    for size in sizes:
+        values = np.random.default_rng(size).random(size) * 1000
+        text = "\n".join(map(repr, values.tolist()))
+        repeat = 1 if size >= 1_000_000 else 3
+
+        # The "Paste values" path: parse the text area, convert, build the CSV
+        parsed = np.array(text.split(), dtype=np.float64)
+        record(results, "batch_parse", measure(lambda: np.array(text.split(), dtype=np.float64), min_time=0, repeat=repeat), rows=size)
+        converted = convert_array(parsed, "Meter", "Foot", "Length")
+        frame = pd.DataFrame({"Value (Meter)": parsed, "Converted (Foot)": converted})
+        record(
+            results, "batch_csv_export",
+            measure(lambda: frame.to_csv(index=False).encode("utf-8"), min_time=0, repeat=repeat), rows=size,
+        )
+
+        # The "Upload file" path: chunked parse, convert and CSV write
+        data = text.encode("utf-8")
+        record(
+            results, "batch_stream_convert",
+            measure(lambda: convert_text_file(io.BytesIO(data), io.BytesIO(), coefficients), min_time=0, repeat=repeat),
+            rows=size,
+        )
+
+        # Several columns of a DataFrame, each with its own units, copied or in place
+        frame = pd.DataFrame({"length": values, "temperature": values, "mass": values, "time": values})
+        specs = {
+            "length": ("Length", "Foot", "Meter"),
+            "temperature": ("Temperature", "Fahrenheit", "Celsius"),
+            "mass": ("Weight/Mass", "Pound", "Kilogram"),
+            "time": ("Time", "Minute", "Hour"),
+        }
+        record(results, "convert_frame", measure(lambda: convert_frame(frame, specs), min_time=0, repeat=repeat), rows=size)
+        record(
+            results, "convert_frame",
+            measure(lambda: convert_frame(frame, specs, inplace=True), min_time=0, repeat=repeat), rows=size, inplace=True,
+        )
+
+        # The "Upload Parquet/Arrow" path: one column converted from the Arrow buffers
+        for file_format in ("parquet", "ipc"):
+            sink = io.BytesIO()
+            table = pa.table({"value": values})
+            if file_format == "parquet":
+                pq.write_table(table, sink)
+            else:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            encoded = sink.getvalue()
+            record(
+                results, "batch_columnar_convert",
+                measure(
+                    lambda: convert_columnar_file(pa.BufferReader(encoded), io.BytesIO(), ["value"], coefficients, file_format),
+                    min_time=0, repeat=repeat,
+                ),
+                rows=size, format=file_format,
+            )
+
+
+def bench_history(results, sizes):
+    from unitconv.history import HistoryBuffer, history_to_csv
+
+    for size in sizes:
+        history = [
+            {
+                "timestamp": "2024-01-01 12:00:00",
+                "category": "Length",
+                "from_value": float(i),
+                "from_unit": "Meter",
+                "to_value": i * 3.28084,
+                "to_unit": "Foot",
+            }
+            for i in range(size)
+        ]
+        record(results, "export_history_to_csv", measure(lambda: history_to_csv(history), min_time=0, repeat=3), entries=size)
+
+        buffer = HistoryBuffer(size)
+        for entry in history:
+            buffer.append(entry["category"], entry["from_value"], entry["from_unit"], entry["to_value"], entry["to_unit"])
+        record(
+            results, "export_history_to_csv", measure(lambda: buffer.to_frame().to_csv(index=False), min_time=0, repeat=3),
+            entries=size, storage="buffer",
+        )
+
+        # Re-exporting after one new conversion only encodes that entry
+        counter = iter(range(size, size * 1000))
+        buffer.to_csv()
+        record(
+            results, "export_history_to_csv",
+            measure(lambda: (buffer.append("Length", float(next(counter)), "Meter", 0.0, "Foot"), buffer.to_csv()), repeat=3),
+            entries=size, storage="buffer", incremental=True,
+        )
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+SUITES = {
+    "convert": lambda results, args: bench_convert(results),
+    "formula": lambda results, args: bench_formula(results),
+    "charts": lambda results, args: bench_charts(results),
+    "search": lambda results, args: bench_search(results),
+    "batch": lambda results, args: bench_batch(results, [s for s in BATCH_SIZES if not args.quick or s < 10_000_000]),
+    "history": lambda results, args: bench_history(results, [s for s in HISTORY_SIZES if not args.quick or s < 1_000_000]),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the unit converter hot paths")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the JSON results")
+    parser.add_argument("--only", nargs="+", choices=sorted(SUITES), help="Run only these suites")
+    parser.add_argument("--quick", action="store_true", help="Skip the largest batch and history sizes")
+    args = parser.parse_args(argv)
+
+    results = []
+    for name in args.only or SUITES:
+        SUITES[name](results, args)
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "results": results,
+    }
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
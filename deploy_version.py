@@ -1,6 +1,8 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from unitconv import categories, convert, convert_temperature, get_formula
+from unitconv.tables import quick_reference_table
 
 # Set page configuration - first Streamlit command
 st.set_page_config(
@@ -166,75 +168,6 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Conversion categories and units
-categories = {
-    "Length": {
-        "Meter": 1,
-        "Kilometer": 0.001,
-        "Centimeter": 100,
-        "Millimeter": 1000,
-        "Mile": 0.000621371,
-        "Yard": 1.09361,
-        "Foot": 3.28084,
-        "Inch": 39.3701
-    },
-    "Weight/Mass": {
-        "Kilogram": 1,
-        "Gram": 1000,
-        "Milligram": 1000000,
-        "Metric Ton": 0.001,
-        "Pound": 2.20462,
-        "Ounce": 35.274
-    },
-    "Temperature": {
-        "Celsius": "base",
-        "Fahrenheit": "derived",
-        "Kelvin": "derived"
-    },
-    "Area": {
-        "Square Meter": 1,
-        "Square Kilometer": 0.000001,
-        "Square Centimeter": 10000,
-        "Square Mile": 3.861e-7,
-        "Square Yard": 1.19599,
-        "Square Foot": 10.7639,
-        "Acre": 0.000247105
-    },
-    "Volume": {
-        "Cubic Meter": 1,
-        "Liter": 1000,
-        "Milliliter": 1000000,
-        "Gallon (US)": 264.172,
-        "Quart (US)": 1056.69,
-        "Pint (US)": 2113.38,
-        "Cup (US)": 4226.75
-    },
-    "Time": {
-        "Second": 1,
-        "Millisecond": 1000,
-        "Minute": 1/60,
-        "Hour": 1/3600,
-        "Day": 1/86400,
-        "Week": 1/604800,
-        "Month (30 days)": 1/2592000,
-        "Year (365 days)": 1/31536000
-    },
-    "Speed": {
-        "Meter per second": 1,
-        "Kilometer per hour": 3.6,
-        "Mile per hour": 2.23694,
-        "Foot per second": 3.28084,
-        "Knot": 1.94384
-    },
-    "Data": {
-        "Byte": 1,
-        "Kilobyte": 1/1024,
-        "Megabyte": 1/(1024**2),
-        "Gigabyte": 1/(1024**3),
-        "Terabyte": 1/(1024**4)
-    }
-}
-
 # Category icons
 category_icons = {
     "Length": "📏",
@@ -247,63 +180,6 @@ category_icons = {
     "Data": "💾"
 }
 
-# Temperature conversion functions
-def convert_temperature(value, from_unit, to_unit):
-    # Convert to Celsius first (our base unit for temperature)
-    if from_unit == "Fahrenheit":
-        celsius = (value - 32) * 5/9
-    elif from_unit == "Kelvin":
-        celsius = value - 273.15
-    else:  # Already Celsius
-        celsius = value
-    
-    # Convert from Celsius to target unit
-    if to_unit == "Celsius":
-        return celsius
-    elif to_unit == "Fahrenheit":
-        return (celsius * 9/5) + 32
-    elif to_unit == "Kelvin":
-        return celsius + 273.15
-
-# Function to perform conversion
-def convert(value, from_unit, to_unit, category, conversion_dict):
-    if from_unit == to_unit:
-        return value
-    
-    # Special case for temperature
-    if category == "Temperature":
-        return convert_temperature(value, from_unit, to_unit)
-    
-    # For direct conversion dictionaries
-    # Convert to base unit first, then to target unit
-    base_value = value / conversion_dict[from_unit]
-    return base_value * conversion_dict[to_unit]
-
-# Get conversion formula
-def get_formula(from_unit, to_unit, category, value, result, decimal_places):
-    if category == "Temperature":
-        if from_unit == "Celsius" and to_unit == "Fahrenheit":
-            return f"{value}°C × (9/5) + 32 = {result:.{decimal_places}f}°F"
-        elif from_unit == "Celsius" and to_unit == "Kelvin":
-            return f"{value}°C + 273.15 = {result:.{decimal_places}f}K"
-        elif from_unit == "Fahrenheit" and to_unit == "Celsius":
-            return f"({value}°F - 32) × (5/9) = {result:.{decimal_places}f}°C"
-        elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
-            return f"({value}°F - 32) × (5/9) + 273.15 = {result:.{decimal_places}f}K"
-        elif from_unit == "Kelvin" and to_unit == "Celsius":
-            return f"{value}K - 273.15 = {result:.{decimal_places}f}°C"
-        elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
-            return f"({value}K - 273.15) × (9/5) + 32 = {result:.{decimal_places}f}°F"
-        else:
-            return "Same unit, no conversion needed"
-    else:
-        if from_unit == to_unit:
-            return "Same unit, no conversion needed"
-        else:
-            conversion_dict = categories[category]
-            factor = conversion_dict[from_unit]/conversion_dict[to_unit]
-            return f"{value} {from_unit} × {1/factor:.{decimal_places}f} = {result:.{decimal_places}f} {to_unit}"
-
 # Sidebar for settings
 with st.sidebar:
     st.markdown("<h3 style='color: #1E88E5;'>Settings</h3>", unsafe_allow_html=True)
@@ -437,24 +313,7 @@ col2.markdown(f"""
 # Quick conversion table
 st.subheader("Quick Reference Table")
 if from_unit != to_unit:
-    values = [0.1, 0.5, 1, 5, 10, 50, 100]
-    if category == "Temperature" and (from_unit == "Kelvin" or to_unit == "Kelvin"):
-        # Adjust values for temperature to be more meaningful
-        if from_unit == "Kelvin" or to_unit == "Kelvin":
-            values = [0, 10, 20, 30, 100, 200, 273.15, 373.15]
-    
-    table_data = {"From": [], "To": []}
-    
-    for val in values:
-        if category == "Temperature":
-            converted = convert_temperature(val, from_unit, to_unit)
-        else:
-            converted = convert(val, from_unit, to_unit, category, categories[category])
-        
-        table_data["From"].append(f"{val} {from_unit}")
-        table_data["To"].append(f"{converted:.{decimal_places}f} {to_unit}")
-    
-    st.table(pd.DataFrame(table_data))
+    st.table(quick_reference_table(category, from_unit, to_unit, decimal_places, spec="f"))
 
 # Footer
 st.markdown("""
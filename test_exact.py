@@ -0,0 +1,50 @@
+from fractions import Fraction
+from itertools import product
+
+import numpy as np
+
+from unitconv.exact import convert_exact, convert_exact_values, exact_tables, to_float
+from unitconv.registry import categories
+
+# Typed values, large and small values, and ones the batch path has to fall back on
+VALUES = [0, 1, -1, 0.1, 0.5, 2.54, 3, -40, 98.6, 123.456, 1e-9, 1e12, 12345.6789, 1.2345678901234567, 1e-20, 5e300]
+
+
+def test_batch_matches_scalar():
+    # convert_exact_values() must give convert_exact() rounded to float, for every
+    # value alone (mostly the integer path) and for all of them at once (the fallback)
+    for category, units in categories.items():
+        for from_unit, to_unit in product(units, repeat=2):
+            coefficients = exact_tables[category][(from_unit, to_unit)]
+            expected = [to_float(convert_exact(value, from_unit, to_unit, category)) for value in VALUES]
+            assert convert_exact_values(VALUES, coefficients).tolist() == expected, (category, from_unit, to_unit)
+            for value, result in zip(VALUES, expected):
+                assert convert_exact_values([value], coefficients).tolist() == [result], (
+                    category, from_unit, to_unit, value)
+
+
+def test_round_trips():
+    # Converting to any unit and back gives the value itself, exactly
+    for category, units in categories.items():
+        for from_unit, to_unit in product(units, repeat=2):
+            for value in VALUES:
+                there = convert_exact(value, from_unit, to_unit, category)
+                assert convert_exact(there, to_unit, from_unit, category) == Fraction(repr(float(value))), (
+                    category, from_unit, to_unit, value)
+
+
+def test_defined_units():
+    assert convert_exact(1, "Inch", "Centimeter", "Length") == Fraction(254, 100)
+    assert convert_exact(1, "Mile", "Foot", "Length") == 5280
+    assert convert_exact(1, "Gallon (US)", "Fluid Ounce (US)", "Volume") == 128
+    assert convert_exact(212, "Fahrenheit", "Celsius", "Temperature") == 100
+    assert convert_exact(1, "Gigabyte", "Byte", "Data") == 2 ** 30
+    assert convert_exact(1, "Terabyte", "Byte", "Data") == 2 ** 40
+    assert convert_exact_values(np.array([1.0, 3.0]), exact_tables["Data"][("Gigabyte", "Megabyte")]).tolist() == [1024, 3072]
+
+
+if __name__ == "__main__":
+    test_batch_matches_scalar()
+    test_round_trips()
+    test_defined_units()
+    print("Exact conversions check out!")
@@ -0,0 +1,109 @@
+import os
+import random
+import tempfile
+
+from unitconv.history import HistoryBuffer, SQLiteHistory
+
+UNITS = [("Length", "Meter", "Foot"), ("Temperature", "Celsius", "Fahrenheit"), ("Data", "Byte", "Kilobyte")]
+
+
+def append_entries(history, start, count, session=None):
+    # Distinct entries, so none is skipped as a repeat
+    for i in range(start, start + count):
+        category, from_unit, to_unit = UNITS[i % len(UNITS)]
+        history.append(category, i + 0.25, from_unit, i * 3.5, to_unit, timestamp=1_700_000_000 + i, session=session)
+
+
+def full_csv(history):
+    return history.to_frame().to_csv(index=False).encode("utf-8")
+
+
+def open_sqlite(directory, **options):
+    return SQLiteHistory(os.path.join(directory, "history.sqlite"), **options)
+
+
+def test_buffer_wraparound():
+    # Incremental exports must match a full export however the ring buffer wrapped,
+    # including when a kept CSV chunk is partly overwritten
+    rng = random.Random(0)
+    for capacity in (1, 2, 3, 7, 50):
+        buffer = HistoryBuffer(capacity)
+        appended = 0
+        for _ in range(40):
+            count = rng.randrange(0, capacity * 3)
+            append_entries(buffer, appended, count)
+            appended += count
+            assert len(buffer) == min(appended, capacity)
+            assert buffer.to_frame()["from_value"].tolist() == [i + 0.25 for i in range(max(appended - capacity, 0), appended)]
+            assert buffer.to_csv() == full_csv(buffer), (capacity, appended)
+
+
+def test_buffer_clear():
+    buffer = HistoryBuffer(5)
+    append_entries(buffer, 0, 12)
+    buffer.to_csv()
+    buffer.clear()
+    assert len(buffer) == 0 and buffer.to_frame().empty
+    append_entries(buffer, 100, 3)
+    assert buffer.to_frame()["from_value"].tolist() == [100.25, 101.25, 102.25]
+    assert buffer.to_csv() == full_csv(buffer)
+
+
+def test_buffer_page():
+    buffer = HistoryBuffer(10)
+    append_entries(buffer, 0, 25)
+    newest_first = [i + 0.25 for i in reversed(range(15, 25))]
+    for offset in range(0, 12):
+        for limit in (1, 3, 10):
+            assert buffer.page(offset, limit)["from_value"].tolist() == newest_first[offset:offset + limit]
+
+
+def test_sqlite_page_across_pending():
+    # Pages mix the newest entries, still pending, with stored ones
+    with tempfile.TemporaryDirectory() as directory:
+        history = open_sqlite(directory, batch_size=4, flush_interval=3600)
+        append_entries(history, 0, 10)
+        assert len(history._pending) == 2
+        newest_first = [i + 0.25 for i in reversed(range(10))]
+        for offset in range(0, 12):
+            for limit in (1, 2, 3, 5, 20):
+                assert history.page(offset, limit)["from_value"].tolist() == newest_first[offset:offset + limit], (offset, limit)
+        assert len(history._pending) == 2, "reading a page must not write"
+        assert history.to_frame()["from_value"].tolist() == newest_first[::-1]
+        history.clear()
+
+
+def test_sqlite_incremental_export():
+    with tempfile.TemporaryDirectory() as directory:
+        history = open_sqlite(directory, batch_size=3, flush_interval=3600)
+        appended = 0
+        for count in (0, 1, 5, 2, 7):
+            append_entries(history, appended, count)
+            appended += count
+            assert history.to_csv() == full_csv(history)
+        history.clear()
+        assert history.to_csv() == full_csv(history)
+        append_entries(history, 1000, 4)
+        assert history.to_csv() == full_csv(history)
+        history.clear()
+
+
+def test_sqlite_sessions():
+    # Repeats are skipped per session, so sessions do not drop each other's entries
+    with tempfile.TemporaryDirectory() as directory:
+        history = open_sqlite(directory)
+        assert history.append("Length", 1.0, "Meter", 3.28, "Foot", session="a")
+        assert history.append("Length", 1.0, "Meter", 3.28, "Foot", session="b")
+        assert not history.append("Length", 1.0, "Meter", 3.28, "Foot", session="a")
+        assert len(history) == 2
+        history.clear()
+
+
+if __name__ == "__main__":
+    test_buffer_wraparound()
+    test_buffer_clear()
+    test_buffer_page()
+    test_sqlite_page_across_pending()
+    test_sqlite_incremental_export()
+    test_sqlite_sessions()
+    print("History checks out!")
@@ -0,0 +1,26 @@
+"""Shared conversion core for the Unit Converter apps.
+
+Importing this package pulls in no UI libraries and not even NumPy; those
+are only loaded by the modules that need them (charts, batch, binary,
+parallel, server) or on the first vectorized conversion.
+"""
+
+from unitconv.calculator import scientific_calculator
+from unitconv.conversions import convert, convert_array, convert_temperature
+from unitconv.engine import TEMPERATURE_UNITS, apply_affine, compile_categories, compile_category
+from unitconv.formulas import get_formula
+from unitconv.registry import categories, conversion_tables
+
+__all__ = [
+    "TEMPERATURE_UNITS",
+    "apply_affine",
+    "categories",
+    "compile_categories",
+    "compile_category",
+    "conversion_tables",
+    "convert",
+    "convert_array",
+    "convert_temperature",
+    "get_formula",
+    "scientific_calculator",
+]
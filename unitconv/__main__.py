@@ -0,0 +1,5 @@
+import sys
+
+from unitconv.cli import main
+
+sys.exit(main())
@@ -0,0 +1,171 @@
+# Static CSS/JS assets for the Streamlit front ends
+#
+# The style sheets and scripts live as plain files in ./assets. Each one is
+# minified and written once per process to ./static/build under a
+# content-hashed name, which Streamlit serves at app/static/build/ when
+# server.enableStaticServing is on. A rerun then only sends a <link> or
+# <script src> tag of a few dozen bytes; the browser fetches each
+# fingerprinted file once and keeps it until its content changes. Without
+# static serving (or a writable build directory) the minified text is
+# inlined instead.
+#
+# Third-party scripts (GSAP, canvas-confetti) are vendored into
+# ./static/vendor under versioned names by `python -m unitconv.assets`, so a
+# page load never waits on an outside network. A script that is not there is
+# left out, with a warning in the log, and the app runs without the
+# animations it drives (the app scripts check for the libraries before
+# use). Loading such scripts from their CDN is an explicit opt-in.
+
+import argparse
+import hashlib
+import logging
+import os
+import re
+import sys
+import urllib.request
+from functools import lru_cache
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSET_DIR = os.path.join(APP_DIR, "assets")
+BUILD_DIR = os.path.join(APP_DIR, "static", "build")
+BUILD_URL = "app/static/build"
+VENDOR_DIR = os.path.join(APP_DIR, "static", "vendor")
+VENDOR_URL = "app/static/vendor"
+
+logger = logging.getLogger(__name__)
+
+# Vendored third-party scripts, in load order, and where they come from
+VENDOR_SCRIPTS = {
+    "gsap-3.11.4.min.js": "https://cdnjs.cloudflare.com/ajax/libs/gsap/3.11.4/gsap.min.js",
+    "ScrollTrigger-3.11.4.min.js": "https://cdnjs.cloudflare.com/ajax/libs/gsap/3.11.4/ScrollTrigger.min.js",
+    "canvas-confetti-1.5.1.min.js": "https://cdn.jsdelivr.net/npm/canvas-confetti@1.5.1/dist/confetti.browser.min.js",
+}
+
+
+def minify_css(text):
+    """Strip comments and redundant whitespace from a style sheet"""
+    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"\s*([{};,>])\s*", r"\1", text)
+    text = re.sub(r":\s+", ":", text)
+    return text.replace(";}", "}").strip()
+
+
+def minify_js(text):
+    # Conservative: only indentation, blank lines and whole-line comments go
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+
+MINIFIERS = {
+    ".css": minify_css,
+    ".js": minify_js,
+}
+
+
+def fingerprint(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:12]
+
+
+@lru_cache(maxsize=None)
+def build_asset(name):
+    """Minify one asset and write its fingerprinted copy; returns (url, text)
+
+    `url` is None if the copy could not be written.
+    """
+    stem, extension = os.path.splitext(name)
+    with open(os.path.join(ASSET_DIR, name), encoding="utf-8") as source:
+        text = MINIFIERS[extension](source.read())
+
+    filename = f"{stem}.{fingerprint(text)}{extension}"
+    path = os.path.join(BUILD_DIR, filename)
+    try:
+        if not os.path.exists(path):
+            os.makedirs(BUILD_DIR, exist_ok=True)
+            # Write under a temporary name so a concurrent reader never sees half a file
+            partial = f"{path}.{os.getpid()}.tmp"
+            with open(partial, "w", encoding="utf-8") as output:
+                output.write(text)
+            os.replace(partial, path)
+    except OSError:
+        return None, text
+    return f"{BUILD_URL}/{filename}", text
+
+
+def asset_html(*names, static=True, media=None):
+    """HTML tags loading the named assets, by URL or inlined when `static` is off
+
+    `media` applies to style sheets, e.g. "(prefers-color-scheme: dark)".
+    """
+    media_attribute = f' media="{media}"' if media else ""
+    tags = []
+    for name in names:
+        url, text = build_asset(name)
+        if name.endswith(".css"):
+            if static and url:
+                tags.append(f'<link rel="stylesheet" href="{url}"{media_attribute}>')
+            else:
+                tags.append(f"<style{media_attribute}>{text}</style>")
+        elif static and url:
+            tags.append(f'<script src="{url}"></script>')
+        else:
+            tags.append(f"<script>{text}</script>")
+    return "\n".join(tags)
+
+
+def vendor_html(static=True, cdn=False):
+    """Script tags for the third-party libraries, in load order
+
+    Each library is served from ./static/vendor when it has been vendored
+    there and static serving is on. Otherwise it is loaded from its CDN if
+    `cdn` is set, and left out (with a warning logged once) if not.
+    """
+    tags = []
+    for name, cdn_url in VENDOR_SCRIPTS.items():
+        if static and os.path.exists(os.path.join(VENDOR_DIR, name)):
+            tags.append(f'<script src="{VENDOR_URL}/{name}"></script>')
+        elif cdn:
+            tags.append(f'<script src="{cdn_url}"></script>')
+        else:
+            _report_missing(name, static)
+    return "\n".join(tags)
+
+
+@lru_cache(maxsize=None)
+def _report_missing(name, static):
+    # Logged once per process and script, not on every rerun
+    if static:
+        logger.warning("%s is not vendored in %s; run `python -m unitconv.assets` to fetch it", name, VENDOR_DIR)
+    else:
+        logger.warning("%s is left out: static serving is off and CDN scripts are not enabled", name)
+
+
+def fetch_vendor_scripts(force=False):
+    """Download the vendored scripts that are missing (or all, with `force`)"""
+    os.makedirs(VENDOR_DIR, exist_ok=True)
+    for name, url in VENDOR_SCRIPTS.items():
+        path = os.path.join(VENDOR_DIR, name)
+        if os.path.exists(path) and not force:
+            print(f"{name}: present")
+            continue
+        with urllib.request.urlopen(url, timeout=30) as response:
+            data = response.read()
+        with open(path, "wb") as output:
+            output.write(data)
+        print(f"{name}: {len(data)} bytes from {url}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Vendor the third-party front-end scripts into static/vendor")
+    parser.add_argument("--force", action="store_true", help="Download again even if a file is present")
+    args = parser.parse_args(argv)
+    try:
+        fetch_vendor_scripts(args.force)
+    except OSError as e:
+        print(f"unitconv.assets: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+# Streaming batch conversion for large text/CSV inputs
+#
+# Files are read in fixed-size chunks that are cut at line boundaries, each
+# chunk is parsed and converted as one NumPy array, and the results are
+# written out before the next chunk is read. Peak memory is therefore a small
+# multiple of the chunk size, whatever the size of the input.
+
+import numpy as np
+
+from unitconv.calculator import evaluate_array
+from unitconv.engine import apply_affine
+from unitconv.exact import convert_exact_values
+
+# Bytes read from the input per chunk
+CHUNK_SIZE = 8 * 1024 * 1024
+
+
+def parse_values(data):
+    """Parse whitespace/newline separated numbers (str or bytes) into a float64 array"""
+    return np.array(data.split(), dtype=np.float64)
+
+
+def iter_value_chunks(source, chunk_size=CHUNK_SIZE):
+    """Yield float64 arrays parsed from a binary file object, one chunk at a time
+
+    Every chunk is cut after its last newline, so no value is ever split
+    across two chunks. Raises ValueError on a non-numeric line.
+    """
+    remainder = b""
+    while True:
+        block = source.read(chunk_size)
+        if not block:
+            break
+        block = remainder + block
+        cut = block.rfind(b"\n") + 1
+        remainder = block[cut:]
+        if cut:
+            yield parse_values(block[:cut])
+
+    if remainder.strip():
+        yield parse_values(remainder)
+
+
+def convert_values(values, coefficients, transform=None, exact=False):
+    """Convert an array, first applying `transform` (a calculator expression in x) if given
+
+    With `exact`, `coefficients` come from unitconv.exact.exact_tables and
+    every value is converted exactly and rounded once (convert_exact_values).
+    """
+    if transform:
+        values = evaluate_array(transform, values)
+    if exact:
+        return convert_exact_values(values, coefficients)
+    return apply_affine(values, coefficients)
+
+
+def iter_converted_chunks(source, coefficients, chunk_size=CHUNK_SIZE, transform=None, exact=False):
+    """Yield (values, converted) array pairs for each chunk of `source`"""
+    for values in iter_value_chunks(source, chunk_size):
+        yield values, convert_values(values, coefficients, transform, exact)
+
+
+def write_csv_header(destination, header):
+    """Write the (value column, converted column) header line"""
+    destination.write(f"{header[0]},{header[1]}\n".encode("utf-8"))
+
+
+def format_csv_rows(values, converted):
+    """Encode one CSV row per (value, converted) pair as UTF-8 bytes"""
+    # repr() of Python floats gives the shortest round-tripping text, like to_csv
+    rows = [f"{value!r},{result!r}\n" for value, result in zip(values.tolist(), converted.tolist())]
+    return "".join(rows).encode("utf-8")
+
+
+def write_csv_rows(destination, values, converted):
+    """Append one CSV row per (value, converted) pair to a binary file object"""
+    destination.write(format_csv_rows(values, converted))
+
+
+def convert_text_file(source, destination, coefficients, header=None, chunk_size=CHUNK_SIZE, transform=None, exact=False):
+    """Stream-convert a one-value-per-line file into a two-column CSV
+
+    `source` and `destination` are binary file objects. `transform` is an
+    optional calculator expression in x applied before converting; `exact`
+    is as for convert_values(). Returns the number of values converted.
+    """
+    if header is not None:
+        write_csv_header(destination, header)
+
+    rows = 0
+    for values, converted in iter_converted_chunks(source, coefficients, chunk_size, transform, exact):
+        write_csv_rows(destination, values, converted)
+        rows += values.size
+    return rows
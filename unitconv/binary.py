@@ -0,0 +1,66 @@
+# Memory-mapped batch conversion for binary arrays
+#
+# Raw little-endian float64/float32 files and .npy files are opened with
+# np.memmap / np.load(mmap_mode="r") and converted block by block straight
+# into a memory-mapped .npy output, so no Python floats or text are ever
+# produced and only one block is touched at a time.
+
+import numpy as np
+
+from unitconv.calculator import evaluate_array
+from unitconv.exact import convert_exact_values
+
+# Raw binary layouts, keyed by file extension
+RAW_DTYPES = {
+    ".f64": "<f8",
+    ".f32": "<f4",
+}
+
+# Values converted per block
+BLOCK_VALUES = 4 * 1024 * 1024
+
+
+def open_binary_input(path, dtype="<f8"):
+    """Memory-map a .npy file, or a raw file of `dtype` values, read-only"""
+    if path.endswith(".npy"):
+        return np.load(path, mmap_mode="r")
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def convert_binary_file(source_path, destination_path, coefficients, dtype="<f8", block_values=BLOCK_VALUES, transform=None,
+                        exact=False):
+    """Convert a binary array file into a float64 .npy file of the same shape
+
+    `dtype` only applies to raw (non-.npy) input. `transform` is an optional
+    calculator expression in x applied before converting. With `exact`,
+    `coefficients` come from unitconv.exact.exact_tables and each block is
+    converted with convert_exact_values(). Returns the number of values
+    converted; raises ValueError for arrays that are not integer or floating
+    point (complex, structured, object, ...).
+    """
+    a, b = coefficients
+    source = open_binary_input(source_path, dtype)
+    if source.dtype.kind not in "iuf":
+        raise ValueError(f"cannot convert an array of {source.dtype}; expected integers or floats")
+    fortran_order = source.flags.f_contiguous and not source.flags.c_contiguous
+    destination = np.lib.format.open_memmap(
+        destination_path, mode="w+", dtype=np.float64, shape=source.shape, fortran_order=fortran_order
+    )
+
+    # Flatten both sides in memory order so every block is a contiguous view
+    order = "F" if fortran_order else "C"
+    flat_source = source.reshape(-1, order=order)
+    flat_destination = destination.reshape(-1, order=order)
+    for start in range(0, flat_source.size, block_values):
+        block = flat_destination[start:start + block_values]
+        values = flat_source[start:start + block_values]
+        if transform:
+            values = evaluate_array(transform, values)
+        if exact:
+            block[...] = convert_exact_values(values, coefficients)
+        else:
+            np.multiply(values, a, out=block)
+            block += b
+
+    destination.flush()
+    return flat_source.size
@@ -0,0 +1,154 @@
+# Scientific calculator
+#
+# Expressions are parsed into an AST, checked against a whitelist, compiled
+# once and kept in an LRU cache keyed by the expression text, so evaluating
+# an unchanged expression costs a cache lookup and one run of the compiled
+# code. Only numbers, arithmetic operators and the names in SAFE_FUNCTIONS
+# may appear: there is no way to reach attributes, builtins or imports.
+#
+# The same expressions can also be evaluated over a whole NumPy array, with
+# `x` standing for each value (e.g. "x * 1.08 + 2"), for batch transforms.
+
+import ast
+import math
+from functools import lru_cache
+
+# Compiled expressions kept in the cache
+EXPRESSION_CACHE_SIZE = 256
+
+# Integer powers whose result would exceed this many bits are computed in
+# floating point, so an input like 9^9^9 overflows immediately instead of
+# running for hours
+MAX_POWER_BITS = 100_000
+
+
+def power(base, exponent, modulus=None):
+    """pow() that will not build astronomically large integers"""
+    if (modulus is None and isinstance(base, int) and isinstance(exponent, int)
+            and abs(exponent) * max(base.bit_length(), 1) > MAX_POWER_BITS):
+        base = float(base)
+    if modulus is None:
+        return base ** exponent
+    return pow(base, exponent, modulus)
+
+
+# Functions and constants available in expressions
+SAFE_FUNCTIONS = {
+    'sin': math.sin,
+    'cos': math.cos,
+    'tan': math.tan,
+    'sqrt': math.sqrt,
+    'log': math.log10,
+    'ln': math.log,
+    'exp': math.exp,
+    'pi': math.pi,
+    'e': math.e,
+    'abs': abs,
+    'pow': power,
+    'round': round
+}
+
+# Names available in array expressions: the calculator's, plus the value x
+ARRAY_NAMES = tuple(SAFE_FUNCTIONS) + ('x',)
+
+# Syntax allowed in expressions; anything else is rejected before compiling
+ALLOWED_NODES = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load, ast.Constant,
+    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow, ast.UAdd, ast.USub,
+)
+
+
+class _PowerRewriter(ast.NodeTransformer):
+    # a ** b -> _power(a, b), so the exponent guard also covers the operator
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Pow):
+            return ast.copy_location(
+                ast.Call(func=ast.Name(id='_power', ctx=ast.Load()), args=[node.left, node.right], keywords=[]),
+                node,
+            )
+        return node
+
+
+def normalize_expression(expression):
+    # Calculator notation -> Python operators
+    return expression.replace('^', '**').replace('×', '*').replace('÷', '/')
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(expression, names=tuple(SAFE_FUNCTIONS)):
+    """Parse, check and compile a calculator expression
+
+    `names` are the identifiers the expression may use. Raises SyntaxError
+    or ValueError for anything that is not a plain arithmetic expression.
+    """
+    tree = ast.parse(normalize_expression(expression).strip(), mode='eval')
+    for node in ast.walk(tree):
+        if not isinstance(node, ALLOWED_NODES):
+            raise ValueError(f"unsupported syntax: {type(node).__name__}")
+        if isinstance(node, ast.Constant) and (isinstance(node.value, bool) or not isinstance(node.value, (int, float))):
+            raise ValueError(f"unsupported constant: {node.value!r}")
+        if isinstance(node, ast.Name) and node.id not in names:
+            raise ValueError(f"unknown name '{node.id}'")
+        if isinstance(node, ast.Call) and (not isinstance(node.func, ast.Name) or node.keywords):
+            raise ValueError("only plain function calls are supported")
+    tree = ast.fix_missing_locations(_PowerRewriter().visit(tree))
+    return compile(tree, '<expression>', 'eval')
+
+
+# Scientific calculator function
+def scientific_calculator(expression):
+    """
+    A simple scientific calculator that evaluates mathematical expressions
+    """
+    try:
+        code = compile_expression(expression)
+        return eval(code, {"__builtins__": {}, "_power": power}, SAFE_FUNCTIONS)
+    except Exception as e:
+        return f"Error: {str(e)}"
+
+
+def array_power(base, exponent, modulus=None):
+    """power() for arrays: always floating point, like the scalar guard's fallback"""
+    import numpy as np
+
+    result = np.power(np.asarray(base, dtype=np.float64), exponent)
+    return result if modulus is None else np.mod(result, modulus)
+
+
+@lru_cache(maxsize=1)
+def array_functions():
+    """SAFE_FUNCTIONS mapped to their NumPy ufunc equivalents"""
+    import numpy as np
+
+    return {
+        'sin': np.sin,
+        'cos': np.cos,
+        'tan': np.tan,
+        'sqrt': np.sqrt,
+        'log': np.log10,
+        'ln': np.log,
+        'exp': np.exp,
+        'pi': np.pi,
+        'e': np.e,
+        'abs': np.abs,
+        'pow': array_power,
+        'round': np.round
+    }
+
+
+def evaluate_array(expression, values):
+    """Evaluate a calculator expression once over an array, with `x` bound to it
+
+    Returns a new float64 array of the same shape as `values`. Raises
+    SyntaxError/ValueError for invalid expressions.
+    """
+    import numpy as np
+
+    x = np.asarray(values, dtype=np.float64)
+    code = compile_expression(expression, ARRAY_NAMES)
+    namespace = dict(array_functions(), x=x)
+    with np.errstate(all='ignore'):
+        result = eval(code, {"__builtins__": {}, "_power": array_power}, namespace)
+    # A constant expression (no x) still gives one result per value
+    return np.array(np.broadcast_to(result, x.shape), dtype=np.float64)
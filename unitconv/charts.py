@@ -0,0 +1,239 @@
+# Plotly figure builders for the Streamlit front ends
+#
+# Plotly is imported inside the builders so that importing unitconv stays
+# cheap for scripts and batch workers that never draw a chart.
+
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+from unitconv.conversions import convert, convert_array
+from unitconv.registry import tables_generation
+
+# Relationship figures kept per FigureCache
+FIGURE_CACHE_SIZE = 32
+
+
+# Function to pick the x-axis range of the relationship chart
+def value_range(from_value):
+    """Upper bound of the sampled input range around `from_value`
+
+    Values in the same bucket share a chart, which is what makes the
+    relationship figures cacheable.
+    """
+    if from_value < 0.1:
+        return 1
+    elif from_value < 1:
+        return 5
+    elif from_value < 10:
+        return 50
+    elif from_value < 100:
+        return 500
+    else:
+        return nice_ceiling(from_value * 5)
+
+
+def nice_ceiling(value):
+    """Smallest 1, 2 or 5 x 10**n that is at least a positive `value`"""
+    if not math.isfinite(value):
+        return value
+    scale = 10.0 ** math.floor(math.log10(value))
+    for step in (1, 2, 5, 10):
+        if step * scale >= value:
+            return step * scale
+
+
+# Function to build the relationship chart without its current-value marker
+def build_relationship_figure(from_unit, to_unit, category, upper, theme="Light"):
+    import plotly.express as px
+
+    values = np.linspace(0, upper, 10)
+    
+    # Convert all values in one vectorized pass
+    converted_values = convert_array(values, from_unit, to_unit, category)
+    
+    # Create a Plotly figure with two y-axes
+    fig = px.line(
+        x=values, 
+        y=converted_values,
+        labels={"x": f"{from_unit}", "y": f"{to_unit}"},
+        title=f"Conversion Relationship: {from_unit} to {to_unit}"
+    )
+    
+    # Enhance the plot with better styling
+    fig.update_layout(
+        plot_bgcolor="rgba(30, 30, 46, 0.8)" if theme == "Dark" else "rgba(240, 242, 246, 0.8)",
+        paper_bgcolor="rgba(30, 30, 46, 0.3)" if theme == "Dark" else "rgba(240, 242, 246, 0.3)",
+        font=dict(
+            family="Arial, sans-serif",
+            size=14,
+            color="#f0f0f0" if theme == "Dark" else "#333"
+        ),
+        title=dict(
+            font=dict(
+                family="Arial, sans-serif",
+                size=20,
+                color="#0066cc"
+            )
+        ),
+        xaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(0, 0, 0, 0.1)',
+            gridwidth=1,
+            zeroline=True,
+            zerolinecolor='rgba(0, 0, 0, 0.2)',
+            zerolinewidth=1,
+            title_font=dict(size=16)
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(0, 0, 0, 0.1)',
+            gridwidth=1,
+            zeroline=True,
+            zerolinecolor='rgba(0, 0, 0, 0.2)',
+            zerolinewidth=1,
+            title_font=dict(size=16)
+        ),
+        margin=dict(l=40, r=40, t=50, b=40),
+        hovermode="x unified"
+    )
+    
+    # Change the line appearance
+    fig.update_traces(
+        line=dict(width=3, color='#0066cc'),
+        mode='lines+markers',
+        marker=dict(size=8, color='#0066cc', line=dict(width=2, color='white'))
+    )
+    
+    # Placeholder for the current-value marker, patched on every use
+    fig.add_scatter(
+        x=[None],
+        y=[None],
+        mode='markers',
+        marker=dict(size=12, color='#ff3b30', line=dict(width=2, color='white')),
+    )
+    
+    return fig
+
+
+class FigureCache:
+    """Bounded LRU of relationship figures
+
+    Keys are (category, from_unit, to_unit, value range, theme). Figures are
+    patched in place, so a cache must not be shared by concurrent script
+    runs; the app keeps one per session. Every figure is dropped once the
+    conversion tables are rebuilt (see unitconv.tables.invalidate_tables),
+    since they were drawn with the old factors.
+    """
+
+    def __init__(self, maxsize=FIGURE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._figures = OrderedDict()
+        self._generation = tables_generation()
+
+    def __len__(self):
+        return len(self._figures)
+
+    def _check_generation(self):
+        generation = tables_generation()
+        if generation != self._generation:
+            self.evict()
+            self._generation = generation
+
+    def get(self, key):
+        self._check_generation()
+        figure = self._figures.get(key)
+        if figure is not None:
+            self._figures.move_to_end(key)
+        return figure
+
+    def put(self, key, figure):
+        self._check_generation()
+        self._figures[key] = figure
+        self._figures.move_to_end(key)
+        while len(self._figures) > self.maxsize:
+            self._figures.popitem(last=False)
+
+    def evict(self, category=None):
+        """Drop every cached figure, or only those of one category"""
+        if category is None:
+            self._figures.clear()
+        else:
+            for key in [key for key in self._figures if key[0] == category]:
+                del self._figures[key]
+
+
+# Function to generate enhanced visualizations
+def create_enhanced_visualization(from_value, from_unit, to_unit, category, theme="Light", cache=None):
+    """Create an enhanced visualization comparing values in two units
+
+    With a FigureCache, the figure for this unit pair, value range and theme
+    is built once and only its current-value marker is updated afterwards.
+    """
+    if from_unit == to_unit:
+        return None
+    
+    upper = value_range(from_value)
+    key = (category, from_unit, to_unit, upper, theme)
+    fig = cache.get(key) if cache is not None else None
+    if fig is None:
+        fig = build_relationship_figure(from_unit, to_unit, category, upper, theme)
+        if cache is not None:
+            cache.put(key, fig)
+    
+    # Add points at specific value
+    fig.data[-1].update(
+        x=[from_value],
+        y=[convert(from_value, from_unit, to_unit, category)],
+        name=f"Current Value: {from_value} {from_unit}"
+    )
+    
+    return fig
+
+
+# Function to create a trend visualization
+def create_trend_visualization(from_value, from_unit, to_unit, category):
+    import plotly.express as px
+
+    if from_unit == to_unit:
+        return None
+    
+    # Create a range of values around the input value
+    if from_value < 0.1:
+        values = np.linspace(0, 1, 10)
+    elif from_value < 1:
+        values = np.linspace(0, 5, 10)
+    elif from_value < 10:
+        values = np.linspace(0, 50, 10)
+    elif from_value < 100:
+        values = np.linspace(0, 500, 10)
+    else:
+        values = np.linspace(0, from_value * 5, 10)
+    
+    # Convert all values in one vectorized pass
+    converted_values = convert_array(values, from_unit, to_unit, category)
+    
+    # Create the plot
+    fig = px.line(
+        x=values, 
+        y=converted_values,
+        labels={"x": f"{from_unit}", "y": f"{to_unit}"},
+        title=f"Conversion Trend: {from_unit} to {to_unit}"
+    )
+    
+    fig.update_layout(
+        plot_bgcolor="white",
+        xaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(0,0,0,0.1)',
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='rgba(0,0,0,0.1)',
+        ),
+        title_font=dict(size=16),
+        margin=dict(l=40, r=40, t=40, b=40),
+    )
+    
+    return fig
@@ -0,0 +1,142 @@
+# Streaming command-line converter for shell pipelines
+#
+#     python -m unitconv Length Mile Kilometer < miles.txt > km.txt
+#     python -m unitconv Temperature Fahrenheit Celsius -c temp_f --header < log.csv
+#
+# Numbers are read from stdin and written to stdout in buffered chunks, so
+# memory use stays constant however long the input is. Plain input is one
+# value per line; with --column, one field of each CSV/TSV row is converted
+# in place and the rest of the row is passed through unchanged.
+
+import argparse
+import csv
+import io
+import os
+import sys
+
+from unitconv.batch import CHUNK_SIZE, iter_value_chunks
+from unitconv.engine import apply_affine
+from unitconv.registry import categories, conversion_tables
+
+# Rows converted per batch in --column mode
+ROWS_PER_BATCH = 65536
+
+
+def format_values(values):
+    """Encode converted values one per line, using the shortest round-tripping repr"""
+    if not values.size:
+        return b""
+    return ("\n".join(map(repr, values.tolist())) + "\n").encode("utf-8")
+
+
+def convert_lines(source, destination, coefficients, chunk_size=CHUNK_SIZE):
+    """Convert a one-value-per-line binary stream; returns the number of values"""
+    count = 0
+    for values in iter_value_chunks(source, chunk_size):
+        destination.write(format_values(apply_affine(values, coefficients)))
+        count += values.size
+    return count
+
+
+def resolve_column(column, header):
+    # Columns are given 1-based (like cut) or by header name
+    if column.isdigit():
+        if int(column) < 1:
+            raise ValueError(f"column numbers start at 1, got {column}")
+        return int(column) - 1
+    if header is None or column not in header:
+        raise ValueError(f"no column named {column!r}")
+    return header.index(column)
+
+
+def convert_column(source, destination, coefficients, column, delimiter=",", header=False):
+    """Convert one field of every CSV/TSV row in a text stream, in batches
+
+    Returns the number of values converted.
+    """
+    reader = csv.reader(source, delimiter=delimiter)
+    writer = csv.writer(destination, delimiter=delimiter, lineterminator="\n")
+
+    header_row = next(reader, None) if header else None
+    if header_row is not None:
+        writer.writerow(header_row)
+    index = resolve_column(column, header_row)
+
+    count = 0
+    rows = []
+    for row in reader:
+        if row:
+            rows.append(row)
+        if len(rows) == ROWS_PER_BATCH:
+            count += _convert_rows(rows, index, coefficients, writer)
+            rows = []
+    if rows:
+        count += _convert_rows(rows, index, coefficients, writer)
+    return count
+
+
+def _convert_rows(rows, index, coefficients, writer):
+    try:
+        converted = apply_affine([row[index] for row in rows], coefficients)
+    except IndexError:
+        raise ValueError(f"column {index + 1} is missing from some rows")
+    for row, value in zip(rows, converted.tolist()):
+        row[index] = repr(value)
+    writer.writerows(rows)
+    return len(rows)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="unitconv",
+        description="Convert numbers read from stdin and write them to stdout.",
+    )
+    parser.add_argument("category", nargs="?", help='Unit category, e.g. "Length"')
+    parser.add_argument("from_unit", nargs="?", help='Unit of the input, e.g. "Mile"')
+    parser.add_argument("to_unit", nargs="?", help='Unit of the output, e.g. "Kilometer"')
+    parser.add_argument("-c", "--column", help="Convert this CSV/TSV column (1-based index or header name)")
+    parser.add_argument("-d", "--delimiter", default=",", help='Field delimiter for --column (default ","; use "\\t" for TSV)')
+    parser.add_argument("--header", action="store_true", help="The first row is a header and is passed through")
+    parser.add_argument("--list", action="store_true", help="List the available categories and units")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not args.list:
+        if not (args.category and args.from_unit and args.to_unit):
+            parser.error("category, from_unit and to_unit are required")
+        try:
+            coefficients = conversion_tables[args.category][(args.from_unit, args.to_unit)]
+        except KeyError:
+            parser.error(f"unknown conversion: {args.category} {args.from_unit} -> {args.to_unit} (see --list)")
+
+    try:
+        if args.list:
+            for category, units in categories.items():
+                print(f"{category}: {', '.join(units)}")
+        elif args.column is None:
+            convert_lines(sys.stdin.buffer, sys.stdout.buffer, coefficients)
+        else:
+            delimiter = "\t" if args.delimiter == "\\t" else args.delimiter
+            source = io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8", newline="")
+            destination = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8", newline="", write_through=False)
+            convert_column(source, destination, coefficients, args.column, delimiter, args.header)
+            destination.flush()
+            destination.detach()
+        sys.stdout.flush()
+    except ValueError as e:
+        print(f"unitconv: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head): stop quietly, and point
+        # stdout at devnull so the interpreter's final flush does not fail too
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+# Scalar and vectorized conversions over the shared registry
+
+from unitconv.engine import apply_affine
+from unitconv.registry import conversion_tables
+
+
+# Temperature conversion functions
+def convert_temperature(value, from_unit, to_unit):
+    a, b = conversion_tables["Temperature"][(from_unit, to_unit)]
+    return value * a + b
+
+
+# Function to perform conversion
+def convert(value, from_unit, to_unit, category, conversion_dict=None):
+    # One lookup and one multiply-add, temperature included.
+    # conversion_dict is accepted for older callers; the tables already hold it.
+    a, b = conversion_tables[category][(from_unit, to_unit)]
+    return value * a + b
+
+
+# Vectorized conversion: any array-like in, float64 NumPy array out
+def convert_array(values, from_unit, to_unit, category):
+    return apply_affine(values, conversion_tables[category][(from_unit, to_unit)])
@@ -0,0 +1,73 @@
+# Affine conversion engine
+#
+# Every unit is stored as an affine map onto its category's base unit:
+#     base = value * scale + offset
+# Ordinary units only have a scale (offset 0); temperature scales are the
+# case where the offset is non-zero. At load time each category is compiled
+# into a table of (from_unit, to_unit) -> (a, b) so that any conversion is a
+# single dict lookup followed by one multiply-add: result = value * a + b.
+#
+# NumPy is only imported by the vectorized path, so the scalar engine loads
+# in a few milliseconds.
+
+# Affine maps onto Celsius, the base unit for temperature
+TEMPERATURE_UNITS = {
+    "Celsius": (1, 0),
+    "Fahrenheit": (5/9, -32 * 5/9),
+    "Kelvin": (1, -273.15),
+}
+
+
+def unit_to_base(unit, factor):
+    """Return the (scale, offset) map from `unit` onto its base unit.
+
+    `factor` is the value stored in the `categories` dict: how many of this
+    unit make up one base unit, or a "base"/"derived" marker for temperature.
+    """
+    if isinstance(factor, str):
+        return TEMPERATURE_UNITS[unit]
+    return 1 / factor, 0
+
+
+def compile_category(units):
+    """Precompute the (a, b) coefficients for every (from, to) pair of a category"""
+    return compile_pairs({unit: unit_to_base(unit, factor) for unit, factor in units.items()})
+
+
+def compile_pairs(to_base):
+    """Pair table from a unit -> (scale, offset) map onto the base unit
+
+    The arithmetic follows the type of the maps, so Fraction maps give
+    exact Fraction coefficients.
+    """
+    table = {}
+    for from_unit, (from_scale, from_offset) in to_base.items():
+        for to_unit, (to_scale, to_offset) in to_base.items():
+            if from_unit == to_unit:
+                # Identity keeps ints as ints, matching the old early return
+                table[(from_unit, to_unit)] = (1, 0)
+            else:
+                table[(from_unit, to_unit)] = (
+                    from_scale / to_scale,
+                    (from_offset - to_offset) / to_scale,
+                )
+    return table
+
+
+def compile_categories(categories):
+    """Compile every category of a `categories` registry into its pair table"""
+    return {category: compile_category(units) for category, units in categories.items()}
+
+
+def apply_affine(values, coefficients):
+    """Convert an array-like of values with one broadcasted multiply-add
+
+    Always returns a new float64 NumPy array; the input is never modified.
+    """
+    import numpy as np
+
+    a, b = coefficients
+    result = np.array(values, dtype=np.float64)
+    result *= a
+    result += b
+    return result
@@ -0,0 +1,248 @@
+# Exact conversions with rational factors
+#
+# The registry stores rounded literals ("Mile": 0.000621371), so a round
+# trip through convert() drifts in the sixth digit. Here each unit is
+# defined by its exact relation to the base unit instead (1 in = 25.4 mm,
+# 1 lb = 0.45359237 kg, 1 US gal = 231 in³, 1 GB = 1024³ bytes, ...) as a
+# Fraction, and the pair tables are compiled from those maps at import, so
+# every (a, b) is an exact rational. Currencies have no defining relation
+# and use the registry rate as written, read as an exact decimal.
+#
+# convert_exact() returns a Fraction. convert_exact_values() is the batch
+# path: it reads the values as integers over a common power of ten and
+# carries out value * a + b as integer arithmetic in float64, which is exact
+# while every integer stays below 2**53, then rounds once with a single
+# division. The result is the exact conversion correctly rounded to float64,
+# at a few vectorized passes per value; inputs that do not fit fall back to
+# Fraction arithmetic per value with the same result.
+
+from decimal import Decimal
+from fractions import Fraction
+from math import gcd
+
+from unitconv.engine import compile_pairs
+from unitconv.registry import categories
+
+INCH = Fraction("0.0254")
+FOOT = 12 * INCH
+YARD = 3 * FOOT
+MILE = 1760 * YARD
+POUND = Fraction("0.45359237")
+GALLON = 231 * INCH ** 3
+
+# Size of one unit in its category's base unit, by definition; temperatures
+# are (scale, offset) maps onto Celsius
+EXACT_UNITS = {
+    "Length": {
+        "Meter": 1,
+        "Kilometer": 1000,
+        "Centimeter": Fraction(1, 100),
+        "Millimeter": Fraction(1, 1000),
+        "Micrometer": Fraction(1, 10**6),
+        "Nanometer": Fraction(1, 10**9),
+        "Mile": MILE,
+        "Yard": YARD,
+        "Foot": FOOT,
+        "Inch": INCH,
+    },
+    "Weight/Mass": {
+        "Kilogram": 1,
+        "Gram": Fraction(1, 1000),
+        "Milligram": Fraction(1, 10**6),
+        "Metric Ton": 1000,
+        "Pound": POUND,
+        "Ounce": POUND / 16,
+    },
+    "Temperature": {
+        "Celsius": (1, 0),
+        "Fahrenheit": (Fraction(5, 9), Fraction(-160, 9)),
+        "Kelvin": (1, Fraction("-273.15")),
+    },
+    "Area": {
+        "Square Meter": 1,
+        "Square Kilometer": 10**6,
+        "Square Centimeter": Fraction(1, 10**4),
+        "Square Mile": MILE ** 2,
+        "Square Yard": YARD ** 2,
+        "Square Foot": FOOT ** 2,
+        "Acre": 43560 * FOOT ** 2,
+        "Hectare": 10**4,
+    },
+    "Volume": {
+        "Cubic Meter": 1,
+        "Liter": Fraction(1, 1000),
+        "Milliliter": Fraction(1, 10**6),
+        "Gallon (US)": GALLON,
+        "Quart (US)": GALLON / 4,
+        "Pint (US)": GALLON / 8,
+        "Cup (US)": GALLON / 16,
+        "Fluid Ounce (US)": GALLON / 128,
+    },
+    "Time": {
+        "Second": 1,
+        "Millisecond": Fraction(1, 1000),
+        "Minute": 60,
+        "Hour": 3600,
+        "Day": 86400,
+        "Week": 604800,
+        "Month (30 days)": 30 * 86400,
+        "Year (365 days)": 365 * 86400,
+    },
+    "Speed": {
+        "Meter per second": 1,
+        "Kilometer per hour": Fraction(1000, 3600),
+        "Mile per hour": MILE / 3600,
+        "Foot per second": FOOT,
+        "Knot": Fraction(1852, 3600),
+    },
+    "Data": {
+        "Byte": 1,
+        "Kilobyte": 1024,
+        "Megabyte": 1024 ** 2,
+        "Gigabyte": 1024 ** 3,
+        "Terabyte": 1024 ** 4,
+    },
+}
+
+# Integers below this are exact in float64
+EXACT_INTEGER_LIMIT = 2 ** 53
+
+# Most decimal places the batch path reads values with
+MAX_DECIMALS = 15
+
+# Values looked at to guess the decimal places before checking all of them
+DECIMAL_SAMPLE = 256
+
+
+def to_fraction(value):
+    """Exact Fraction of a number or decimal string
+
+    Floats are read as their shortest decimal representation, i.e. 0.1 is
+    1/10 (the value that was typed), not the binary approximation.
+    """
+    if isinstance(value, float):
+        return Fraction(repr(value))
+    if isinstance(value, (Fraction, int, Decimal)):
+        return Fraction(value)
+    return Fraction(str(value).strip())
+
+
+def to_float(fraction):
+    """Nearest float64 to a Fraction, ±inf past the largest float like float arithmetic"""
+    try:
+        return float(fraction)
+    except OverflowError:
+        return float("inf") if fraction > 0 else float("-inf")
+
+
+def exact_to_base(category, unit):
+    """(scale, offset) Fractions mapping `unit` onto its category's base unit"""
+    size = EXACT_UNITS.get(category, {}).get(unit)
+    if isinstance(size, tuple):
+        return tuple(Fraction(part) for part in size)
+    if size is None:
+        # Registry literal: how many of this unit make up one base unit
+        size = 1 / to_fraction(categories[category][unit])
+    return Fraction(size), Fraction(0)
+
+
+def compile_exact_tables():
+    """Exact pair tables for every category of the registry"""
+    return {
+        category: compile_pairs({unit: exact_to_base(category, unit) for unit in units})
+        for category, units in categories.items()
+    }
+
+
+exact_tables = compile_exact_tables()
+
+
+def rebuild_exact_tables():
+    """Recompile exact_tables in place after the registry has been edited"""
+    tables = compile_exact_tables()
+    exact_tables.update(tables)
+    for category in exact_tables.keys() - tables.keys():
+        del exact_tables[category]
+
+
+def convert_exact(value, from_unit, to_unit, category):
+    """Convert a value exactly; returns a Fraction"""
+    a, b = exact_tables[category][(from_unit, to_unit)]
+    return to_fraction(value) * a + b
+
+
+def convert_exact_values(values, coefficients):
+    """Convert values exactly, rounded once to float64
+
+    `values` is an array-like of numbers or numeric strings, each read as
+    the shortest decimal that round-trips (like to_fraction() reads a
+    float); `coefficients` is an (a, b) pair from `exact_tables`. Returns a
+    new float64 array; raises ValueError for values that are not finite
+    numbers.
+    """
+    import numpy as np
+
+    values = np.array(values, dtype=np.float64)
+    a, b = (Fraction(c) for c in coefficients)
+    result = _convert_scaled(values.reshape(-1), a, b)
+    if result is not None:
+        result = result.reshape(values.shape)
+    else:
+        result = np.array([to_float(to_fraction(value) * a + b) for value in values.ravel().tolist()],
+                          dtype=np.float64).reshape(values.shape)
+    return result
+
+
+def _convert_scaled(values, a, b):
+    # `values` is 1-D. Each value is m / 10**k for integer m, so value * a + b is
+    #     (m * (p * s) + r * q * 10**k) / (q * s * 10**k)
+    # for a = p/q, b = r/s. Returns None when that cannot be done exactly.
+    import numpy as np
+
+    if not values.size or not np.isfinite(values).all():
+        return None
+
+    # Smallest k for which every value round-trips through m / 10**k. A
+    # sample settles k first, so typical data takes a single full pass;
+    # only the values that have not round-tripped yet are tried again.
+    scale = 1
+    pending = values
+    with np.errstate(over="ignore"):
+        # Values too large to scale overflow to inf and never round-trip
+        for _ in range(MAX_DECIMALS + 1):
+            if _round_trips(pending[:DECIMAL_SAMPLE], scale).all():
+                pending = pending[~_round_trips(pending, scale)]
+                if not pending.size:
+                    break
+            scale *= 10
+        else:
+            return None
+
+    scaled = values * scale
+    np.rint(scaled, out=scaled)
+    largest = max(-float(scaled.min()), float(scaled.max()))
+    # values * scale is within half a unit of m only while m is well inside float64 precision
+    if largest >= EXACT_INTEGER_LIMIT // 4:
+        return None
+
+    multiplier = a.numerator * b.denominator
+    addend = b.numerator * a.denominator * scale
+    divisor = a.denominator * b.denominator * scale
+    common = gcd(multiplier, addend, divisor)
+    multiplier, addend, divisor = multiplier // common, addend // common, divisor // common
+    if largest * abs(multiplier) + abs(addend) >= EXACT_INTEGER_LIMIT or divisor >= EXACT_INTEGER_LIMIT:
+        return None
+
+    scaled *= multiplier
+    scaled += addend
+    scaled /= divisor
+    return scaled
+
+
+def _round_trips(values, scale):
+    import numpy as np
+
+    scaled = values * scale
+    np.rint(scaled, out=scaled)
+    scaled /= scale
+    return scaled == values
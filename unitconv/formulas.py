@@ -0,0 +1,35 @@
+# Human-readable conversion formulas
+
+from unitconv.registry import categories
+
+
+# Get conversion formula
+def get_formula(from_unit, to_unit, category, value, result, decimal_places=None):
+    """Describe how `value` in `from_unit` became `result` in `to_unit`
+
+    Numbers are shown to 6 significant digits, or with `decimal_places`
+    fixed decimals when given.
+    """
+    spec = ".6g" if decimal_places is None else f".{decimal_places}f"
+    if category == "Temperature":
+        if from_unit == "Celsius" and to_unit == "Fahrenheit":
+            return f"{value}°C × (9/5) + 32 = {result:{spec}}°F"
+        elif from_unit == "Celsius" and to_unit == "Kelvin":
+            return f"{value}°C + 273.15 = {result:{spec}}K"
+        elif from_unit == "Fahrenheit" and to_unit == "Celsius":
+            return f"({value}°F - 32) × (5/9) = {result:{spec}}°C"
+        elif from_unit == "Fahrenheit" and to_unit == "Kelvin":
+            return f"({value}°F - 32) × (5/9) + 273.15 = {result:{spec}}K"
+        elif from_unit == "Kelvin" and to_unit == "Celsius":
+            return f"{value}K - 273.15 = {result:{spec}}°C"
+        elif from_unit == "Kelvin" and to_unit == "Fahrenheit":
+            return f"({value}K - 273.15) × (9/5) + 32 = {result:{spec}}°F"
+        else:
+            return "Same unit, no conversion needed"
+    else:
+        if from_unit == to_unit:
+            return "Same unit, no conversion needed"
+        else:
+            conversion_dict = categories[category]
+            factor = conversion_dict[from_unit]/conversion_dict[to_unit]
+            return f"{value} {from_unit} × {1/factor:{spec}} = {result:{spec}} {to_unit}"
@@ -0,0 +1,117 @@
+# Multi-column DataFrame conversion
+#
+# convert_frame() takes a mapping of column -> (category, from_unit,
+# to_unit) and converts every listed column with its own coefficients, one
+# vectorized multiply-add per column buffer, so the data is passed over
+# once whatever the number of columns.
+#
+# With inplace=True, float64 columns are overwritten in their existing
+# buffers through NumPy views and no column is copied. Before a buffer is
+# written one value is set through pandas, so under copy-on-write (always
+# on from pandas 3) the frame first gets its own copy if the buffer is
+# shared with another frame or Series. Without copy-on-write, objects that
+# view the same data see the change, as with any in-place pandas operation.
+# Columns of other dtypes (integers, float32, nullable types) cannot hold
+# the results and are replaced by new float64 columns, missing values
+# becoming NaN.
+#
+# Without inplace the result is a new frame. Under copy-on-write it starts
+# as a shallow copy, so only the converted columns are copied; otherwise it
+# is a deep copy, since writing through a shallow copy's buffers would
+# change the caller's frame.
+
+from unitconv.registry import conversion_tables
+
+
+def frame_coefficients(specs):
+    """(a, b) coefficients for each column of a {column: (category, from_unit, to_unit)} mapping
+
+    Raises ValueError for an unknown category or unit.
+    """
+    coefficients = {}
+    for column, (category, from_unit, to_unit) in specs.items():
+        try:
+            coefficients[column] = conversion_tables[category][(from_unit, to_unit)]
+        except KeyError:
+            raise ValueError(f"column '{column}': cannot convert {from_unit} to {to_unit} in {category}") from None
+    return coefficients
+
+
+def convert_frame(frame, specs, inplace=False):
+    """Convert several columns of a DataFrame, each between its own pair of units
+
+    `specs` maps column names to (category, from_unit, to_unit), e.g.
+    {"length": ("Length", "Foot", "Meter"), "temp": ("Temperature",
+    "Fahrenheit", "Celsius")}. Unlisted columns are left as they are.
+    Returns a new DataFrame, or None with `inplace`, in which case `frame`
+    itself is modified. Raises ValueError for a missing or duplicated column
+    or an unknown unit.
+    """
+    if not inplace:
+        # Under copy-on-write a shallow copy shares every buffer until a column
+        # is written, which copies just that data
+        frame = frame.copy(deep=not copy_on_write())
+
+    for column, coefficients in frame_coefficients(specs).items():
+        position = column_position(frame, column)
+        values = writable_column(frame, position)
+        if values is None:
+            values = frame.iloc[:, position].to_numpy(dtype="float64", na_value=float("nan"), copy=True)
+            _apply(values, coefficients)
+            frame.isetitem(position, values)
+        else:
+            _apply(values, coefficients)
+
+    return None if inplace else frame
+
+
+def copy_on_write():
+    """Whether pandas copy-on-write is in effect (always from pandas 3)"""
+    import pandas as pd
+
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.options.mode.copy_on_write is True
+
+
+def column_position(frame, column):
+    """Integer position of a uniquely named column"""
+    if column not in frame.columns:
+        raise ValueError(f"no column named '{column}'")
+    position = frame.columns.get_loc(column)
+    if not isinstance(position, int):
+        raise ValueError(f"more than one column is named '{column}'")
+    return position
+
+
+def writable_column(frame, position):
+    """A writable NumPy view of a float64 column's buffer, or None for other dtypes
+
+    Under copy-on-write the frame is made the sole owner of the buffer
+    first, so writing through the view cannot change any other frame or
+    Series.
+    """
+    if frame.dtypes.iloc[position] != "float64":
+        return None
+    if len(frame):
+        # A write through pandas triggers copy-on-write if it is on and the buffer is shared
+        frame.iloc[0, position] = frame.iloc[0, position]
+    values = frame.iloc[:, position].to_numpy()
+    if values.base is None:
+        # Not a view of the buffer after all
+        return None
+    if not values.flags.writeable:
+        try:
+            values.flags.writeable = True
+        except ValueError:
+            # The buffer itself is read-only, e.g. a read-only memory map
+            return None
+    return values
+
+
+def _apply(values, coefficients):
+    # result = value * a + b, written into `values`
+    a, b = coefficients
+    values *= a
+    if b:
+        values += b
@@ -0,0 +1,397 @@
+# Conversion history helpers shared by the front ends and the benchmarks
+#
+# HistoryBuffer keeps a session's conversions in fixed-size typed columns
+# (a ring buffer), so a session that stays open all day holds at most
+# `capacity` entries of a few dozen bytes each instead of an ever-growing
+# list of dicts. Category and unit names are stored as small integer codes.
+#
+# SQLiteHistory has the same interface but keeps the history in a SQLite
+# database (WAL mode), shared by every session of the process and kept
+# across restarts. Appends are buffered and written in batches; reading a
+# page merges the pending entries in rather than forcing a write.
+#
+# Both stores build their CSV export incrementally, so each export only
+# encodes the entries added since the previous one. HistoryBuffer keeps the
+# encoded chunks of its (bounded) entries in memory; SQLiteHistory, whose
+# history can grow to millions of rows, appends them to a temporary CSV file
+# instead and only holds the rows of one chunk at a time.
+
+import atexit
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+
+# Entries kept per session before the oldest are overwritten
+HISTORY_CAPACITY = 10_000
+
+# SQLiteHistory writes once this many appends are pending, or the oldest
+# pending append is this many seconds old
+HISTORY_BATCH_SIZE = 100
+HISTORY_FLUSH_INTERVAL = 2.0
+
+# Sessions whose last entry SQLiteHistory remembers for skipping repeats
+HISTORY_SESSIONS = 1024
+
+# Rows encoded per chunk of a CSV export
+EXPORT_CHUNK_ROWS = 10_000
+
+HISTORY_COLUMNS = ["timestamp", "category", "from_value", "from_unit", "to_value", "to_unit"]
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+CSV_HEADER = (",".join(HISTORY_COLUMNS) + "\n").encode('utf-8')
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    timestamp INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    from_value REAL NOT NULL,
+    from_unit TEXT NOT NULL,
+    to_value REAL NOT NULL,
+    to_unit TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_timestamp ON history (timestamp);
+CREATE INDEX IF NOT EXISTS history_category ON history (category);
+"""
+
+
+class HistoryBuffer:
+    """Fixed-capacity, columnar ring buffer of conversions
+
+    Appending a conversion identical to the previous one is a no-op, so
+    reruns that did not change anything do not fill the buffer.
+    """
+
+    def __init__(self, capacity=HISTORY_CAPACITY):
+        import numpy as np
+
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self.categories = np.zeros(capacity, dtype=np.int16)
+        self.from_units = np.zeros(capacity, dtype=np.int16)
+        self.to_units = np.zeros(capacity, dtype=np.int16)
+        self.from_values = np.zeros(capacity, dtype=np.float64)
+        self.to_values = np.zeros(capacity, dtype=np.float64)
+        self.names = []
+        self._codes = {}
+        self._next = 0
+        self._size = 0
+        self._last = None
+        # Entries appended since the last clear(); entry n lives at n % capacity
+        self._appended = 0
+        # Encoded CSV chunks as [first entry number, row count, bytes]
+        self._csv_chunks = deque()
+        self._csv_next = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def _code(self, name):
+        code = self._codes.get(name)
+        if code is None:
+            code = self._codes[name] = len(self.names)
+            self.names.append(name)
+        return code
+
+    def append(self, category, from_value, from_unit, to_value, to_unit, timestamp=None, session=None):
+        """Record one conversion; returns False if it repeated the previous one
+
+        `session` is accepted for compatibility with SQLiteHistory; a buffer
+        belongs to a single session.
+        """
+        key = (category, from_value, from_unit, to_unit)
+        with self._lock:
+            if key == self._last:
+                return False
+            self._last = key
+
+            i = self._next
+            self.timestamps[i] = int(time.time()) if timestamp is None else timestamp
+            self.categories[i] = self._code(category)
+            self.from_units[i] = self._code(from_unit)
+            self.to_units[i] = self._code(to_unit)
+            self.from_values[i] = from_value
+            self.to_values[i] = to_value
+            self._next = (i + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+            self._appended += 1
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._next = 0
+            self._size = 0
+            self._last = None
+            self._appended = 0
+            self._csv_chunks.clear()
+            self._csv_next = 0
+
+    def order(self):
+        """Buffer positions of the stored entries, oldest first"""
+        import numpy as np
+
+        return np.arange(self._next - self._size, self._next) % self.capacity
+
+    def to_frame(self):
+        """The stored entries as a DataFrame, oldest first, with local-time timestamps"""
+        return self._frame(self.order())
+
+    def page(self, offset, limit):
+        """`limit` entries as a DataFrame, newest first, skipping the `offset` newest"""
+        return self._frame(self.order()[::-1][offset:offset + limit])
+
+    def to_csv(self):
+        """The stored entries as UTF-8 CSV bytes, encoding only entries not exported before"""
+        import numpy as np
+
+        with self._lock:
+            first = self._appended - self._size
+            # Forget rows the ring buffer has overwritten since the last export
+            while self._csv_chunks and self._csv_chunks[0][0] + self._csv_chunks[0][1] <= first:
+                self._csv_chunks.popleft()
+            if self._csv_chunks and self._csv_chunks[0][0] < first:
+                start, count, data = self._csv_chunks[0]
+                cut = 0
+                for _ in range(first - start):
+                    cut = data.index(b"\n", cut) + 1
+                self._csv_chunks[0] = [first, count - (first - start), data[cut:]]
+
+            start = max(self._csv_next, first)
+            for chunk_start in range(start, self._appended, EXPORT_CHUNK_ROWS):
+                numbers = np.arange(chunk_start, min(chunk_start + EXPORT_CHUNK_ROWS, self._appended))
+                data = self._frame(numbers % self.capacity).to_csv(index=False, header=False).encode('utf-8')
+                self._csv_chunks.append([chunk_start, numbers.size, data])
+            self._csv_next = self._appended
+            return CSV_HEADER + b"".join(chunk[2] for chunk in self._csv_chunks)
+
+    def _frame(self, order):
+        import pandas as pd
+
+        names = pd.Index(self.names, dtype=object)
+        return pd.DataFrame({
+            "timestamp": [time.strftime(TIMESTAMP_FORMAT, time.localtime(t)) for t in self.timestamps[order].tolist()],
+            "category": pd.Categorical.from_codes(self.categories[order], categories=names),
+            "from_value": self.from_values[order],
+            "from_unit": pd.Categorical.from_codes(self.from_units[order], categories=names),
+            "to_value": self.to_values[order],
+            "to_unit": pd.Categorical.from_codes(self.to_units[order], categories=names),
+        }, columns=HISTORY_COLUMNS)
+
+
+class SQLiteHistory:
+    """Conversion history in a SQLite database, with batched writes
+
+    Safe to share between the script threads of all sessions. Appends are
+    queued and written in one transaction once `batch_size` are pending,
+    the oldest pending entry is `flush_interval` seconds old (a timer thread
+    writes them even if nothing else is appended), the CSV is exported, or
+    the process exits. Pages and frames include the pending entries without
+    writing them.
+    """
+
+    def __init__(self, path, batch_size=HISTORY_BATCH_SIZE, flush_interval=HISTORY_FLUSH_INTERVAL):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            self._connection.executescript(HISTORY_SCHEMA)
+        self._count = self._connection.execute("SELECT count(*) FROM history").fetchone()[0]
+        self._pending = []
+        self._pending_since = None
+        # Writes the pending entries once the oldest is flush_interval seconds old
+        self._timer = None
+        # Last entry appended by each recent session, for skipping repeats
+        self._last = OrderedDict()
+        # Temporary file holding the CSV export, and the last row id it covers
+        self._csv_path = None
+        self._csv_last_id = 0
+        atexit.register(self.flush)
+
+    def __len__(self):
+        return self._count + len(self._pending)
+
+    def append(self, category, from_value, from_unit, to_value, to_unit, timestamp=None, session=None):
+        """Queue one conversion; returns False if it repeated `session`'s previous one
+
+        `session` identifies the caller's session (any hashable), so sessions
+        sharing the database skip only their own repeats.
+        """
+        key = (category, from_value, from_unit, to_unit)
+        with self._lock:
+            if self._last.get(session) == key:
+                return False
+            self._last[session] = key
+            self._last.move_to_end(session)
+            if len(self._last) > HISTORY_SESSIONS:
+                self._last.popitem(last=False)
+            now = time.time()
+            self._pending.append((
+                int(now) if timestamp is None else timestamp,
+                category, float(from_value), from_unit, float(to_value), to_unit,
+            ))
+            if self._pending_since is None:
+                self._pending_since = now
+                self._start_timer()
+            if len(self._pending) >= self.batch_size or now - self._pending_since >= self.flush_interval:
+                self._flush()
+        return True
+
+    def _start_timer(self):
+        self._timer = threading.Timer(min(self.flush_interval, threading.TIMEOUT_MAX), self.flush)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _cancel_timer(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def flush(self):
+        """Write all pending entries"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not self._pending:
+            return
+        with self._connection:
+            self._connection.executemany(
+                "INSERT INTO history (timestamp, category, from_value, from_unit, to_value, to_unit) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                self._pending,
+            )
+        self._count += len(self._pending)
+        self._pending = []
+        self._pending_since = None
+        self._cancel_timer()
+
+    def clear(self):
+        with self._lock:
+            self._pending = []
+            self._pending_since = None
+            self._cancel_timer()
+            self._last.clear()
+            with self._connection:
+                self._connection.execute("DELETE FROM history")
+            self._count = 0
+            self._discard_csv()
+
+    def to_frame(self):
+        """All stored entries as a DataFrame, oldest first"""
+        import pandas as pd
+
+        with self._lock:
+            frame = pd.read_sql_query(f"SELECT {', '.join(HISTORY_COLUMNS)} FROM history ORDER BY id", self._connection)
+            pending = list(self._pending)
+        return _format_timestamps(_with_rows(frame, pending))
+
+    def page(self, offset, limit):
+        """`limit` entries as a DataFrame, newest first, skipping the `offset` newest
+
+        Pending entries (the newest) are taken from the queue and only the
+        rest of the page is read from the database; nothing is written.
+        """
+        import pandas as pd
+
+        with self._lock:
+            newest = self._pending[::-1]
+            rows = newest[offset:offset + limit]
+            frame = pd.read_sql_query(
+                f"SELECT {', '.join(HISTORY_COLUMNS)} FROM history ORDER BY id DESC LIMIT ? OFFSET ?",
+                self._connection, params=(limit - len(rows), max(offset - len(newest), 0)),
+            )
+        return _format_timestamps(_with_rows(frame, rows, before=True))
+
+    def to_csv(self):
+        """All stored entries as UTF-8 CSV bytes, read from the file export_csv() keeps"""
+        with self._lock:
+            with open(self._export_csv(), "rb") as export:
+                return export.read()
+
+    def export_csv(self):
+        """Path of a CSV file of all stored entries, brought up to date
+
+        The file is temporary and removed with this object or at exit. Only
+        rows not exported before are read and encoded, a chunk at a time, and
+        appended to it.
+        """
+        with self._lock:
+            return self._export_csv()
+
+    def _export_csv(self):
+        import pandas as pd
+
+        self._flush()
+        if self._csv_path is None:
+            with tempfile.NamedTemporaryFile(prefix="history_export_", suffix=".csv", delete=False) as export:
+                export.write(CSV_HEADER)
+            self._csv_path = export.name
+            self._csv_finalizer = weakref.finalize(self, _remove_file, self._csv_path)
+        chunks = pd.read_sql_query(
+            f"SELECT id, {', '.join(HISTORY_COLUMNS)} FROM history WHERE id > ? ORDER BY id",
+            self._connection, params=(self._csv_last_id,), chunksize=EXPORT_CHUNK_ROWS,
+        )
+        try:
+            with open(self._csv_path, "ab") as export:
+                for frame in chunks:
+                    if frame.empty:
+                        continue
+                    last_id = int(frame["id"].iloc[-1])
+                    frame = _format_timestamps(frame.drop(columns="id"))
+                    export.write(frame.to_csv(index=False, header=False).encode('utf-8'))
+                    self._csv_last_id = last_id
+        except OSError:
+            # A half-written chunk would corrupt later exports; start over next time
+            self._discard_csv()
+            raise
+        return self._csv_path
+
+    def _discard_csv(self):
+        if self._csv_path is not None:
+            self._csv_finalizer()
+            self._csv_path = None
+        self._csv_last_id = 0
+
+
+def _remove_file(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _with_rows(frame, rows, before=False):
+    # `frame` with pending entry tuples added after it, or before it
+    import pandas as pd
+
+    if not rows:
+        return frame
+    pending = pd.DataFrame(rows, columns=HISTORY_COLUMNS)
+    if frame.empty:
+        return pending
+    return pd.concat([pending, frame] if before else [frame, pending], ignore_index=True)
+
+
+def _format_timestamps(frame):
+    # Epoch seconds -> local time strings, as in the CSV export
+    frame["timestamp"] = [time.strftime(TIMESTAMP_FORMAT, time.localtime(t)) for t in frame["timestamp"].tolist()]
+    return frame
+
+
+def history_to_csv(history):
+    """Encode a HistoryBuffer/SQLiteHistory, or a list of history entries (dicts), as UTF-8 CSV bytes"""
+    import pandas as pd
+
+    if isinstance(history, (HistoryBuffer, SQLiteHistory)):
+        return history.to_csv()
+    return pd.DataFrame(history).to_csv(index=False).encode('utf-8')
@@ -0,0 +1,65 @@
+# Dense pairwise conversion matrices
+#
+# Every category is compiled at import into an N x N matrix of factors,
+# plus one of offsets where the category has any (only Temperature), with a
+# unit -> index map to address them:
+#     result = value * factors[i, j] + offsets[i, j]
+# converts unit i to unit j. A whole row converts one unit to every unit of
+# its category in a single broadcast. The matrices are built from the same
+# pair tables as convert(), so both give identical results; they are marked
+# read-only because every caller shares them.
+
+import numpy as np
+
+from unitconv.registry import categories, conversion_tables
+
+
+def compile_matrix(units, table):
+    """Return (factors, offsets) for `units`, in order; offsets is None when all zero"""
+    factors = np.array([[table[(from_unit, to_unit)][0] for to_unit in units] for from_unit in units], dtype=np.float64)
+    offsets = np.array([[table[(from_unit, to_unit)][1] for to_unit in units] for from_unit in units], dtype=np.float64)
+    factors.flags.writeable = False
+    if not offsets.any():
+        return factors, None
+    offsets.flags.writeable = False
+    return factors, offsets
+
+
+unit_index = {}
+factor_matrices = {}
+offset_matrices = {}
+
+
+def build_matrices():
+    """(Re)compile every category of the registry into the shared matrices"""
+    for category, units in categories.items():
+        unit_index[category] = {unit: i for i, unit in enumerate(units)}
+        factor_matrices[category], offset_matrices[category] = compile_matrix(list(units), conversion_tables[category])
+
+
+build_matrices()
+
+
+def conversion_row(category, from_unit, to_units=None):
+    """(a, b) coefficient arrays from `from_unit` to each of `to_units` (default: all units)
+
+    `b` is None for categories without offsets.
+    """
+    index = unit_index[category]
+    row = index[from_unit]
+    columns = slice(None) if to_units is None else [index[unit] for unit in to_units]
+    offsets = offset_matrices[category]
+    return factor_matrices[category][row, columns], None if offsets is None else offsets[row, columns]
+
+
+def convert_to_units(values, category, from_unit, to_units=None):
+    """Convert values into several units at once
+
+    Returns a float64 array with one column per target unit (shape
+    values.shape + (len(to_units),)); a scalar value gives a 1-D row.
+    """
+    a, b = conversion_row(category, from_unit, to_units)
+    result = np.multiply.outer(np.asarray(values, dtype=np.float64), a)
+    if b is not None:
+        result += b
+    return result
@@ -0,0 +1,112 @@
+# Multi-process sharded batch conversion
+#
+# A large text file is split into byte ranges that end on line boundaries.
+# Each shard is parsed, converted and formatted as CSV in a worker process
+# (text parsing and formatting are CPU-bound and would otherwise be stuck on
+# the GIL). Workers hand their output back through
+# multiprocessing.shared_memory rather than pickling it, and the parent
+# copies the shards into the destination strictly in file order.
+#
+# Parsing, conversion and CSV formatting reuse unitconv.batch, so the output
+# is byte-for-byte identical to the single-process path.
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from unitconv.batch import convert_values, format_csv_rows, parse_values, write_csv_header
+
+# Target bytes per shard; files smaller than this are not worth sharding
+SHARD_SIZE = 64 * 1024 * 1024
+
+
+def shard_ranges(path, shard_size=SHARD_SIZE):
+    """Split a file into (start, end) byte ranges that each end after a newline"""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as source:
+        while start < size:
+            end = start + shard_size
+            if end >= size:
+                end = size
+            else:
+                # Extend the shard to the end of the line it lands in
+                source.seek(end)
+                source.readline()
+                end = source.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _convert_shard(path, start, end, coefficients, transform=None, exact=False):
+    # Runs in a worker: convert one shard into CSV rows in a shared memory block
+    with open(path, "rb") as source:
+        source.seek(start)
+        values = parse_values(source.read(end - start))
+    rows = format_csv_rows(values, convert_values(values, coefficients, transform, exact))
+
+    block = shared_memory.SharedMemory(create=True, size=max(len(rows), 1))
+    block.buf[:len(rows)] = rows
+    block.close()
+    return block.name, values.size, len(rows)
+
+
+def _drain_shard(name, count, size, destination):
+    # Runs in the parent: copy a finished shard out and release its memory
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        if destination is not None:
+            with block.buf[:size] as rows:
+                destination.write(rows)
+    finally:
+        block.close()
+        block.unlink()
+    return count
+
+
+def convert_file_parallel(path, destination, coefficients, header=None, workers=None, shard_size=SHARD_SIZE, transform=None,
+                          exact=False):
+    """Convert a one-value-per-line file into a two-column CSV using a process pool
+
+    `destination` is a binary file object; `transform` and `exact` are as
+    for convert_text_file. At most two shards per worker are in flight at once,
+    which bounds memory use. Returns the number of values converted; raises
+    ValueError on a non-numeric line, like the single-process path.
+    """
+    workers = workers or os.cpu_count() or 1
+    if header is not None:
+        write_csv_header(destination, header)
+
+    ranges = iter(shard_ranges(path, shard_size))
+    pending = deque()
+    rows = 0
+
+    # Spawn rather than fork: the Streamlit server is multi-threaded
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+
+        def submit_next():
+            shard = next(ranges, None)
+            if shard is not None:
+                pending.append(executor.submit(_convert_shard, path, shard[0], shard[1], coefficients, transform, exact))
+
+        for _ in range(workers * 2):
+            submit_next()
+
+        try:
+            while pending:
+                name, count, size = pending.popleft().result()
+                submit_next()
+                rows += _drain_shard(name, count, size, destination)
+        except BaseException:
+            # Release the shared memory of every shard still in flight
+            for future in pending:
+                if not future.cancel() and future.exception() is None:
+                    _drain_shard(*future.result(), destination=None)
+            raise
+
+    return rows
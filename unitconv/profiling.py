@@ -0,0 +1,73 @@
+# Per-rerun section timing for the Streamlit front ends
+#
+# A SectionTimer measures named sections of one script run and keeps a
+# rolling window of past runs per section, so slow blocks can be spotted
+# from the app itself. NullTimer has the same interface and does nothing,
+# which keeps the instrumented code free of `if profiling:` checks.
+
+import time
+from collections import deque
+
+# Past runs kept per section for the rolling percentiles
+TIMING_WINDOW = 200
+
+
+def percentile(samples, fraction):
+    """Nearest-rank percentile of a non-empty sequence"""
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SectionTimer:
+    """Time named sections of a rerun and keep rolling history per section
+
+    `history` is a dict of deques that outlives the timer (e.g. one kept in
+    st.session_state); it is filled in by finish().
+    """
+
+    def __init__(self, history=None, window=TIMING_WINDOW):
+        self.history = history if history is not None else {}
+        self.window = window
+        self.current = {}
+        self._started = {}
+
+    def start(self, name):
+        self._started[name] = time.perf_counter()
+
+    def stop(self, name):
+        elapsed = time.perf_counter() - self._started.pop(name)
+        self.current[name] = self.current.get(name, 0.0) + elapsed
+
+    def finish(self):
+        """Fold this rerun's timings into the rolling history"""
+        for name, elapsed in self.current.items():
+            self.history.setdefault(name, deque(maxlen=self.window)).append(elapsed)
+
+    def summary(self):
+        """One row per section: this rerun, rolling p50/p95 (all in ms) and run count"""
+        rows = []
+        for name, samples in self.history.items():
+            rows.append({
+                "Section": name,
+                "Last (ms)": round(self.current.get(name, 0.0) * 1000, 2),
+                "p50 (ms)": round(percentile(samples, 0.50) * 1000, 2),
+                "p95 (ms)": round(percentile(samples, 0.95) * 1000, 2),
+                "Runs": len(samples),
+            })
+        return rows
+
+
+class NullTimer:
+    """Drop-in SectionTimer replacement used when profiling is off"""
+
+    def start(self, name):
+        pass
+
+    def stop(self, name):
+        pass
+
+    def finish(self):
+        pass
+
+    def summary(self):
+        return []
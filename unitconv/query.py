@@ -0,0 +1,213 @@
+# Free-text conversion queries
+#
+# Queries such as "5.2 km to mi", "72F in C" or "3 GB -> MB" are parsed
+# into (value, category, from_unit, to_unit). Unit names are resolved
+# through an alias index built once at import from the registry: each
+# unit's name, its plural and "metre" spellings, square/cubic forms of the
+# length symbols, and the symbols and abbreviations in UNIT_SYMBOLS, all
+# lower-cased, in one dict. A query costs one regex match and two dict
+# lookups, so parsing is linear in its length.
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from unitconv.registry import categories, conversion_tables
+
+# Parsed queries kept in the cache
+QUERY_CACHE_SIZE = 1024
+
+# Symbols and abbreviations for the registry's units; explicit entries win
+# over names generated from the registry
+UNIT_SYMBOLS = {
+    "Length": {
+        "Meter": ["m"],
+        "Kilometer": ["km"],
+        "Centimeter": ["cm"],
+        "Millimeter": ["mm"],
+        "Micrometer": ["um", "µm", "μm", "micron", "microns"],
+        "Nanometer": ["nm"],
+        "Mile": ["mi"],
+        "Yard": ["yd", "yds"],
+        "Foot": ["ft", "'"],
+        "Inch": ["in", '"'],
+    },
+    "Weight/Mass": {
+        "Kilogram": ["kg", "kilo", "kilos"],
+        "Gram": ["g"],
+        "Milligram": ["mg"],
+        "Metric Ton": ["t", "ton", "tons", "tonne", "tonnes"],
+        "Pound": ["lb", "lbs"],
+        "Ounce": ["oz"],
+    },
+    "Temperature": {
+        "Celsius": ["c", "°c", "degc", "deg c", "centigrade"],
+        "Fahrenheit": ["f", "°f", "degf", "deg f"],
+        "Kelvin": ["k", "kelvins"],
+    },
+    "Area": {
+        "Square Kilometer": ["km2", "km²", "sq km"],
+        "Acre": ["ac"],
+        "Hectare": ["ha"],
+    },
+    "Volume": {
+        "Cubic Meter": ["m3", "m³", "cu m"],
+        "Liter": ["l", "litre", "litres"],
+        "Milliliter": ["ml", "millilitre", "millilitres", "cc"],
+        "Gallon (US)": ["gal"],
+        "Quart (US)": ["qt"],
+        "Pint (US)": ["pt"],
+        "Cup (US)": ["cup"],
+        "Fluid Ounce (US)": ["fl oz", "floz"],
+    },
+    "Time": {
+        "Second": ["s", "sec", "secs"],
+        "Millisecond": ["ms", "msec"],
+        "Minute": ["min", "mins"],
+        "Hour": ["h", "hr", "hrs"],
+        "Day": ["d"],
+        "Week": ["wk", "wks"],
+        "Month (30 days)": ["mo"],
+        "Year (365 days)": ["y", "yr", "yrs"],
+    },
+    "Speed": {
+        "Meter per second": ["m/s", "mps"],
+        "Kilometer per hour": ["km/h", "kmh", "kph", "km/hr"],
+        "Mile per hour": ["mph", "mi/h", "mi/hr"],
+        "Foot per second": ["ft/s", "fps"],
+        "Knot": ["kn", "kt", "kts"],
+    },
+    "Data": {
+        "Byte": ["b"],
+        "Kilobyte": ["kb"],
+        "Megabyte": ["mb"],
+        "Gigabyte": ["gb"],
+        "Terabyte": ["tb"],
+    },
+    "Currency": {
+        "USD": ["$", "us$", "dollar", "dollars"],
+        "EUR": ["€", "euro", "euros"],
+        "GBP": ["£", "sterling"],
+        "JPY": ["¥", "yen"],
+        "CAD": ["c$"],
+        "AUD": ["a$"],
+        "CNY": ["yuan", "rmb"],
+        "INR": ["₹", "rupee", "rupees"],
+    },
+}
+
+# Irregular plurals of the last word of a unit name
+IRREGULAR_PLURALS = {
+    "foot": "feet",
+}
+
+# Prefixes and suffixes that turn a length into the matching area or volume unit
+POWER_FORMS = (
+    ("Area", "Square", ("sq ", "sq. ", "square "), ("2", "²")),
+    ("Volume", "Cubic", ("cu ", "cubic "), ("3", "³")),
+)
+
+# "<number> <unit> <separator> <unit>"; the separator needs whitespace
+# around words, so "5 in to cm" still reads "in" as inches
+QUERY_PATTERN = re.compile(
+    r"\s*(?P<value>[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)\s*"
+    r"(?P<from_unit>.+?)"
+    r"(?:\s+(?:to|in|into|as)\s+|\s*(?:->|→|=>|=)\s*)"
+    r"(?P<to_unit>.+?)\s*",
+    re.IGNORECASE,
+)
+
+ParsedQuery = namedtuple("ParsedQuery", ["value", "category", "from_unit", "to_unit"])
+
+
+def normalize_alias(text):
+    # Case, surrounding whitespace, inner runs of whitespace and a trailing "." don't matter
+    return " ".join(text.lower().split()).rstrip(".")
+
+
+def pluralize(name):
+    """Plural of a lower-case unit name ("foot" -> "feet", "meter per second" -> "meters per second")"""
+    head, separator, tail = name.partition(" per ")
+    words = head.split(" ")
+    last = words[-1]
+    if last in IRREGULAR_PLURALS:
+        words[-1] = IRREGULAR_PLURALS[last]
+    elif last.endswith(("s", "x", "ch", "sh")):
+        words[-1] = last + "es"
+    else:
+        words[-1] = last + "s"
+    return " ".join(words) + separator + tail
+
+
+def unit_names(unit):
+    """Spelled-out names for a unit: with and without any "(...)" note, plurals and "metre" spellings"""
+    name = unit.lower()
+    bare = re.sub(r"\s*\(.*?\)", "", name).strip()
+    names = {name, bare, pluralize(bare)}
+    names |= {spelling.replace("meter", "metre") for spelling in names}
+    return names
+
+
+def build_alias_index(registry=categories, symbols=UNIT_SYMBOLS):
+    """Map every alias (lower-cased) to its (category, unit)"""
+    index = {}
+    for category, units in registry.items():
+        for unit in units:
+            for alias in unit_names(unit):
+                index.setdefault(normalize_alias(alias), (category, unit))
+
+    # Square and cubic forms of the length names and symbols, e.g. "sq ft", "m2", "ft³"
+    for category, word, prefixes, suffixes in POWER_FORMS:
+        for unit in registry.get("Length", {}):
+            target = f"{word} {unit}"
+            if target not in registry.get(category, {}):
+                continue
+            for name in unit_names(unit):
+                for prefix in prefixes:
+                    index.setdefault(normalize_alias(prefix + name), (category, target))
+            for symbol in symbols.get("Length", {}).get(unit, []):
+                if symbol.isalpha():
+                    for affixed in [prefix + symbol for prefix in prefixes] + [symbol + suffix for suffix in suffixes]:
+                        index.setdefault(normalize_alias(affixed), (category, target))
+
+    for category, units in symbols.items():
+        for unit, aliases in units.items():
+            if unit in registry.get(category, {}):
+                for alias in aliases:
+                    index[normalize_alias(alias)] = (category, unit)
+    return index
+
+
+alias_index = build_alias_index()
+
+
+def resolve_unit(text):
+    """(category, unit) for a unit name, symbol or alias; raises ValueError if unknown"""
+    try:
+        return alias_index[normalize_alias(text)]
+    except KeyError:
+        raise ValueError(f"unknown unit '{text.strip()}'") from None
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def parse_query(text):
+    """Parse "5.2 km to mi" into ParsedQuery(5.2, "Length", "Kilometer", "Mile")
+
+    Raises ValueError if the query is malformed, names an unknown unit or
+    mixes categories.
+    """
+    match = QUERY_PATTERN.fullmatch(text)
+    if match is None:
+        raise ValueError("expected a query like '5.2 km to mi'")
+    category, from_unit = resolve_unit(match["from_unit"])
+    to_category, to_unit = resolve_unit(match["to_unit"])
+    if to_category != category:
+        raise ValueError(f"cannot convert {from_unit} ({category}) to {to_unit} ({to_category})")
+    return ParsedQuery(float(match["value"]), category, from_unit, to_unit)
+
+
+def convert_query(text):
+    """Parse and evaluate a query; returns (ParsedQuery, result)"""
+    query = parse_query(text)
+    a, b = conversion_tables[query.category][(query.from_unit, query.to_unit)]
+    return query, query.value * a + b
@@ -0,0 +1,116 @@
+# Unit registry shared by the apps and the conversion service
+#
+# Each unit maps to how many of it make up one base unit (the entry equal to
+# 1); temperature units are marked "base"/"derived" and use the affine maps
+# in unitconv.engine.
+
+from unitconv.engine import compile_categories
+
+# Conversion categories and units
+categories = {
+    "Length": {
+        "Meter": 1,
+        "Kilometer": 0.001,
+        "Centimeter": 100,
+        "Millimeter": 1000,
+        "Micrometer": 1000000,  # 1 meter = 1,000,000 micrometers
+        "Nanometer": 1000000000,  # 1 meter = 1,000,000,000 nanometers
+        "Mile": 0.000621371,
+        "Yard": 1.09361,
+        "Foot": 3.28084,
+        "Inch": 39.3701
+    },
+    "Weight/Mass": {
+        "Kilogram": 1,
+        "Gram": 1000,
+        "Milligram": 1000000,
+        "Metric Ton": 0.001,
+        "Pound": 2.20462,
+        "Ounce": 35.274
+    },
+    "Temperature": {
+        "Celsius": "base",
+        "Fahrenheit": "derived",
+        "Kelvin": "derived"
+    },
+    "Area": {
+        "Square Meter": 1,
+        "Square Kilometer": 0.000001,
+        "Square Centimeter": 10000,
+        "Square Mile": 3.861e-7,
+        "Square Yard": 1.19599,
+        "Square Foot": 10.7639,
+        "Acre": 0.000247105,
+        "Hectare": 0.0001
+    },
+    "Volume": {
+        "Cubic Meter": 1,
+        "Liter": 1000,
+        "Milliliter": 1000000,
+        "Gallon (US)": 264.172,
+        "Quart (US)": 1056.69,
+        "Pint (US)": 2113.38,
+        "Cup (US)": 4226.75,
+        "Fluid Ounce (US)": 33814
+    },
+    "Time": {
+        "Second": 1,
+        "Millisecond": 1000,
+        "Minute": 1/60,
+        "Hour": 1/3600,
+        "Day": 1/86400,
+        "Week": 1/604800,
+        "Month (30 days)": 1/2592000,
+        "Year (365 days)": 1/31536000
+    },
+    "Speed": {
+        "Meter per second": 1,
+        "Kilometer per hour": 3.6,
+        "Mile per hour": 2.23694,
+        "Foot per second": 3.28084,
+        "Knot": 1.94384
+    },
+    "Data": {
+        "Byte": 1,
+        "Kilobyte": 1/1024,
+        "Megabyte": 1/(1024**2),
+        "Gigabyte": 1/(1024**3),
+        "Terabyte": 1/(1024**4)
+    },
+    "Currency": {
+        "USD": 1,
+        "EUR": 0.92,
+        "GBP": 0.79,
+        "JPY": 149.5,
+        "CAD": 1.36,
+        "AUD": 1.52,
+        "CNY": 7.24,
+        "INR": 83.12
+    }
+}
+
+# Every (from, to) pair of every category, precompiled at import
+conversion_tables = compile_categories(categories)
+
+# Bumped every time the tables are rebuilt, so caches of derived results can tell
+_generation = 0
+
+
+def tables_generation():
+    """How many times conversion_tables has been rebuilt since import"""
+    return _generation
+
+
+def rebuild_conversion_tables():
+    """Recompile conversion_tables in place after `categories` has been edited
+
+    The dict object is kept, so every module that imported it sees the new
+    tables; each category's table is swapped in whole.
+    """
+    global _generation
+
+    tables = compile_categories(categories)
+    conversion_tables.update(tables)
+    for category in conversion_tables.keys() - tables.keys():
+        del conversion_tables[category]
+    _generation += 1
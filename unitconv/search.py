@@ -0,0 +1,124 @@
+# Fuzzy unit search
+#
+# UnitSearchIndex is a trigram index over unit names and aliases (the
+# alias index of unitconv.query). Each alias is split into the overlapping
+# three-character pieces of its padded, lower-cased text, and every trigram
+# maps to an int32 array of the aliases containing it. A search counts, in
+# one np.bincount over the posting arrays of the query's trigrams, how many
+# trigrams every alias shares with the query, and ranks by the Jaccard
+# similarity of the two trigram sets. Only the posting arrays of the query's
+# own trigrams are touched, so a search takes microseconds even for
+# thousands of units, and typos ("kilomter") still match.
+#
+# unit_search_index() builds the index for the registry once per process;
+# every session shares it.
+
+from collections import defaultdict, namedtuple
+from functools import lru_cache
+
+import numpy as np
+
+from unitconv.query import alias_index, normalize_alias
+
+# Matches scoring below this are not returned
+MIN_SCORE = 0.1
+
+UnitMatch = namedtuple("UnitMatch", ["score", "category", "unit", "alias"])
+
+
+def trigrams(text):
+    """The set of trigrams of a normalized text, padded so short texts and word starts count"""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class UnitSearchIndex:
+    """Trigram index over {alias: (category, unit)}"""
+
+    def __init__(self, aliases):
+        self.aliases = []
+        self.targets = []
+        target_ids = {}
+        entry_targets = []
+        postings = defaultdict(list)
+        sizes = []
+        for alias, target in aliases.items():
+            alias = normalize_alias(alias)
+            grams = trigrams(alias)
+            entry = len(self.aliases)
+            self.aliases.append(alias)
+            if target not in target_ids:
+                target_ids[target] = len(self.targets)
+                self.targets.append(target)
+            entry_targets.append(target_ids[target])
+            sizes.append(len(grams))
+            for gram in grams:
+                postings[gram].append(entry)
+
+        self.entry_targets = np.array(entry_targets, dtype=np.int32)
+        self.sizes = np.array(sizes, dtype=np.float64)
+        self.postings = {gram: np.array(entries, dtype=np.int32) for gram, entries in postings.items()}
+
+    def __len__(self):
+        return len(self.aliases)
+
+    def search(self, text, limit=10, category=None, min_score=MIN_SCORE):
+        """Units best matching `text`, as UnitMatch tuples, best first and one per unit
+
+        `category` restricts the matches to one category.
+        """
+        grams = trigrams(normalize_alias(text))
+        lists = [self.postings[gram] for gram in grams if gram in self.postings]
+        if not lists:
+            return []
+
+        # Jaccard similarity |query & alias| / |query | alias| of every alias, negated for ranking
+        shared = np.bincount(np.concatenate(lists), minlength=len(self.aliases)).astype(np.float64)
+        scores = self.sizes + float(len(grams))
+        scores -= shared
+        np.divide(shared, scores, out=scores)
+        np.negative(scores, out=scores)
+
+        # Rank only the best few aliases; a unit can have several among them,
+        # so look further only when too few distinct units were found
+        depth = limit * 4
+        while True:
+            matches, exhausted = self._rank(scores, depth, limit, category, min_score)
+            if len(matches) == limit or exhausted:
+                return matches
+            depth *= 4
+
+    def _rank(self, scores, depth, limit, category, min_score):
+        # Returns (matches, exhausted); exhausted when no alias beyond `depth` could be added
+        if depth < len(scores):
+            top = np.argpartition(scores, depth)[:depth]
+        else:
+            top = np.arange(len(scores))
+        # Best score first; among equal scores, the shorter (closer) alias first
+        top = top[np.lexsort((self.sizes[top], scores[top]))]
+
+        matches = []
+        seen = set()
+        for entry in top.tolist():
+            score = -float(scores[entry])
+            if score < min_score:
+                return matches, True
+            target = self.targets[self.entry_targets[entry]]
+            if target in seen or (category is not None and target[0] != category):
+                continue
+            seen.add(target)
+            matches.append(UnitMatch(score, target[0], target[1], self.aliases[entry]))
+            if len(matches) == limit:
+                break
+        return matches, depth >= len(scores)
+
+
+@lru_cache(maxsize=1)
+def unit_search_index():
+    """The search index for the registry, built on first use and shared by every caller"""
+    return UnitSearchIndex(alias_index)
+
+
+def search_units(text, limit=10, category=None):
+    """Search the registry's units by name or alias; see UnitSearchIndex.search"""
+    return unit_search_index().search(text, limit, category)
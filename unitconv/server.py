@@ -0,0 +1,219 @@
+# Headless JSON conversion service
+#
+# A small HTTP/1.1 server on plain asyncio (no third-party dependencies) that
+# answers conversions from the same precompiled tables as the Streamlit apps,
+# without any UI cost per request. Connections are kept alive, so clients
+# that reuse a connection pay only for parsing and one multiply-add.
+#
+#     python -m unitconv.server --host 0.0.0.0 --port 8502
+#
+# Endpoints:
+#     GET  /categories      {"Length": ["Meter", ...], ...}
+#     POST /convert         {"category", "from_unit", "to_unit", "value"}
+#                           -> {"result": ...}
+#     POST /convert/bulk    {"category", "from_unit", "to_unit", "values": [...]}
+#                           -> {"results": [...]}
+#     POST /query           {"query": "5.2 km to mi"}
+#                           -> {"category", "from_unit", "to_unit", "value", "result"}
+#     POST /units/search    {"query": "kilomter", "limit": 10, "category": optional}
+#                           -> {"matches": [{"score", "category", "unit", "alias"}, ...]}
+#
+# Errors are answered as {"error": ...}; values or results that do not fit
+# in a float64 are rejected with 400, since JSON has no Infinity or NaN.
+
+import argparse
+import asyncio
+import json
+import math
+from http import HTTPStatus
+
+from unitconv.engine import apply_affine
+from unitconv.query import convert_query
+from unitconv.search import search_units
+from unitconv.registry import categories, conversion_tables
+
+# Reject request bodies larger than this many bytes
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+
+class RequestError(Exception):
+    """A client error, reported back as a JSON error response"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def lookup(payload):
+    # Resolve the (a, b) coefficients named by a request payload
+    try:
+        category, from_unit, to_unit = payload["category"], payload["from_unit"], payload["to_unit"]
+    except (KeyError, TypeError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "category, from_unit and to_unit are required")
+    try:
+        return conversion_tables[category][(from_unit, to_unit)]
+    except (KeyError, TypeError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Unknown conversion: {category} {from_unit} -> {to_unit}")
+
+
+def out_of_range():
+    return RequestError(HTTPStatus.BAD_REQUEST, "value out of range: results must be finite numbers")
+
+
+def handle_categories(payload):
+    return CATEGORY_UNITS
+
+
+def handle_convert(payload):
+    a, b = lookup(payload)
+    value = payload.get("value")
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "value must be a number")
+    try:
+        result = value * a + b
+    except OverflowError:
+        # An integer too large for a float
+        raise out_of_range()
+    if not math.isfinite(result):
+        raise out_of_range()
+    return {"result": result}
+
+
+def handle_bulk(payload):
+    import numpy as np
+
+    coefficients = lookup(payload)
+    values = payload.get("values")
+    if not isinstance(values, list):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "values must be a list of numbers")
+    try:
+        with np.errstate(over="ignore", invalid="ignore"):
+            results = apply_affine(values, coefficients)
+    except (TypeError, ValueError):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "values must be a list of numbers")
+    except OverflowError:
+        raise out_of_range()
+    # JSON has no Infinity or NaN
+    if not np.isfinite(results).all():
+        raise out_of_range()
+    return {"results": results.tolist()}
+
+
+def handle_query(payload):
+    text = payload.get("query") if isinstance(payload, dict) else None
+    if not isinstance(text, str):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "query must be a string like '5.2 km to mi'")
+    try:
+        query, result = convert_query(text)
+    except ValueError as e:
+        raise RequestError(HTTPStatus.BAD_REQUEST, f"Invalid query: {e}")
+    if not math.isfinite(result):
+        raise out_of_range()
+    return {**query._asdict(), "result": result}
+
+
+def handle_search(payload):
+    text = payload.get("query") if isinstance(payload, dict) else None
+    if not isinstance(text, str):
+        raise RequestError(HTTPStatus.BAD_REQUEST, "query must be a string")
+    limit = payload.get("limit", 10)
+    if isinstance(limit, bool) or not isinstance(limit, int) or limit < 1:
+        raise RequestError(HTTPStatus.BAD_REQUEST, "limit must be a positive integer")
+    matches = search_units(text, limit, payload.get("category"))
+    return {"matches": [match._asdict() for match in matches]}
+
+
+CATEGORY_UNITS = {category: list(units) for category, units in categories.items()}
+
+ROUTES = {
+    ("GET", "/categories"): handle_categories,
+    ("POST", "/convert"): handle_convert,
+    ("POST", "/convert/bulk"): handle_bulk,
+    ("POST", "/query"): handle_query,
+    ("POST", "/units/search"): handle_search,
+}
+
+
+def dispatch(method, path, body):
+    """Route one request and return (status, response object)"""
+    handler = ROUTES.get((method, path.split("?", 1)[0]))
+    if handler is None:
+        return HTTPStatus.NOT_FOUND, {"error": f"No route for {method} {path}"}
+    try:
+        payload = json.loads(body) if body else {}
+    except ValueError:
+        # Malformed JSON, or an integer literal longer than int() accepts
+        return HTTPStatus.BAD_REQUEST, {"error": "Request body must be JSON"}
+    try:
+        return HTTPStatus.OK, handler(payload)
+    except RequestError as e:
+        return e.status, {"error": str(e)}
+
+
+async def handle_connection(reader, writer):
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            try:
+                method, path, version = request_line.decode("latin-1").split()
+            except ValueError:
+                break
+
+            headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+
+            try:
+                length = int(headers.get("content-length", 0) or 0)
+            except ValueError:
+                break
+            if length > MAX_BODY_SIZE:
+                status, response = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, {"error": "Request body too large"}
+                keep_alive = False
+            else:
+                body = await reader.readexactly(length) if length else b""
+                status, response = dispatch(method, path, body)
+                connection = headers.get("connection", "").lower()
+                keep_alive = connection != "close" and (version == "HTTP/1.1" or connection == "keep-alive")
+
+            data = json.dumps(response, allow_nan=False).encode("utf-8")
+            writer.write(
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(data)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data
+            )
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8502):
+    server = await asyncio.start_server(handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless JSON unit conversion service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# Cached Quick Reference and Unit Comparison tables
+#
+# The tables only depend on the category, the units and the display
+# precision, so each distinct table is computed once per process and then
+# shared by every session and rerun. The returned DataFrames are shared:
+# callers must treat them as read-only. Call invalidate_tables() after
+# editing the registry's `categories` so the conversion tables, matrices
+# and cached tables are all recompiled from it.
+
+from functools import lru_cache
+
+from unitconv.exact import rebuild_exact_tables
+from unitconv.matrix import build_matrices, convert_to_units
+from unitconv.registry import rebuild_conversion_tables
+
+# Sample values shown in the reference tables
+REFERENCE_VALUES = (0.1, 0.5, 1, 5, 10, 50, 100)
+KELVIN_REFERENCE_VALUES = (0, 10, 20, 30, 100, 200, 273.15, 373.15)
+
+# Distinct tables kept per builder
+TABLE_CACHE_SIZE = 256
+
+
+def reference_values(category, from_unit, to_unit):
+    # Temperatures around 0-100 mean little in Kelvin, so use meaningful points
+    if category == "Temperature" and "Kelvin" in (from_unit, to_unit):
+        return KELVIN_REFERENCE_VALUES
+    return REFERENCE_VALUES
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def quick_reference_table(category, from_unit, to_unit, decimal_places, spec="g"):
+    """From/To table of the reference values converted between two units
+
+    `spec` is the format type of the converted column ("g" or "f").
+    """
+    import pandas as pd
+
+    values = reference_values(category, from_unit, to_unit)
+    converted = convert_to_units(values, category, from_unit, (to_unit,))[:, 0]
+
+    return pd.DataFrame({
+        "From": [f"{value} {from_unit}" for value in values],
+        "To": [f"{result:.{decimal_places}{spec}} {to_unit}" for result in converted.tolist()],
+    })
+
+
+@lru_cache(maxsize=TABLE_CACHE_SIZE)
+def comparison_table(category, units, decimal_places):
+    """Reference values of units[0] expressed in every unit of `units`
+
+    `units` must be a tuple. All columns come from one broadcast of the
+    reference values against the reference unit's row of the factor matrix.
+    """
+    import pandas as pd
+
+    reference_unit = units[0]
+    converted = convert_to_units(REFERENCE_VALUES, category, reference_unit, units)
+
+    return pd.DataFrame(
+        {unit: [f"{result:.{decimal_places}g}" for result in column] for unit, column in zip(units, converted.T.tolist())},
+        index=[f"{value} {reference_unit}" for value in REFERENCE_VALUES],
+    )
+
+
+def invalidate_tables():
+    """Recompile everything derived from the registry and forget every cached table
+
+    Call after editing `categories`, e.g. new currency rates: the pair
+    tables (float and exact) and the factor matrices are rebuilt from it.
+    """
+    rebuild_conversion_tables()
+    rebuild_exact_tables()
+    build_matrices()
+    quick_reference_table.cache_clear()
+    comparison_table.cache_clear()
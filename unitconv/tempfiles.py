@@ -0,0 +1,65 @@
+# Temporary batch output files
+#
+# Converted batches are written to temporary files that can be several GB,
+# and are kept until the session starts another conversion so the download
+# button can still serve them. A BatchOutput ties its file to the object's
+# lifetime: keep it in the session's state and the file is removed when the
+# session ends and its state is garbage collected, or when the process
+# exits. Files left over from a crash are removed by
+# sweep_stale_outputs() once they are older than STALE_OUTPUT_AGE.
+
+import os
+import tempfile
+import time
+import weakref
+
+# Name prefix of the batch output files
+OUTPUT_PREFIX = "batch_conversion_"
+
+# Seconds after which a leftover output file is swept away; the download
+# button keeps its own copy of the data, so only abandoned files are this old
+STALE_OUTPUT_AGE = 3600
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+class BatchOutput:
+    """A temporary output file that is removed with this object"""
+
+    def __init__(self, suffix=""):
+        with tempfile.NamedTemporaryFile(prefix=OUTPUT_PREFIX, suffix=suffix, delete=False) as output_file:
+            self.path = output_file.name
+        self._finalizer = weakref.finalize(self, _remove, self.path)
+
+    def discard(self):
+        """Remove the file now"""
+        self._finalizer()
+
+
+def sweep_stale_outputs(max_age=STALE_OUTPUT_AGE, directory=None):
+    """Remove batch output files last modified more than `max_age` seconds ago
+
+    Returns the number of files removed.
+    """
+    directory = directory or tempfile.gettempdir()
+    cutoff = time.time() - max_age
+    removed = 0
+    try:
+        entries = list(os.scandir(directory))
+    except OSError:
+        return 0
+    for entry in entries:
+        if not entry.name.startswith(OUTPUT_PREFIX):
+            continue
+        try:
+            if entry.is_file() and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+                removed += 1
+        except OSError:
+            pass
+    return removed